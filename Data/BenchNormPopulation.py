@@ -0,0 +1,141 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import NormPopulation
+
+# ========================================
+# BenchNormPopulation.py
+#  NormPopulation Wide→Long 변환: 기존 iterrows 방식 vs 열 단위(stack) 방식 비교
+# ========================================
+
+    # - 합성 데이터: 행정기관 N개 × (12개월 × 6필드) / (3년 × 9필드)
+    # - 두 방식의 결과를 CSV 문자열로 비교해 출력이 동일한지 먼저 확인
+    # - 각 방식 repeat 회 실행 중 최솟값을 기록
+
+
+# ---------- 기존 구현 (iterrows) ----------
+def legacy_monthly(df: pd.DataFrame, year: int, agencies: set) -> pd.DataFrame:
+    records = []
+    for _, row in df.iterrows():
+        agency_code = int(row['행정기관코드'])
+        agency_name = str(row['행정기관']).strip()
+        agencies.add((agency_code, agency_name))
+        for m in range(1, 13):
+            records.append({
+                "agency_code":       agency_code,
+                "year":              year,
+                "month":             m,
+                "total_pop":         int(row[f"{m}월총인구수"]),
+                "household":         int(row[f"{m}월세대수"]),
+                "pop_per_household": float(row[f"{m}월세대당인구"]),
+                "male":              int(row[f"{m}월남자인구수"]),
+                "female":            int(row[f"{m}월여자인구수"]),
+                "ratio":             float(row[f"{m}월남여비율"]),
+            })
+    return pd.DataFrame(records, columns=[
+        "agency_code", "year", "month", "total_pop",
+        "household", "pop_per_household", "male", "female", "ratio"
+    ])
+
+def legacy_yearly(df: pd.DataFrame, years: list, agencies: set) -> pd.DataFrame:
+    records = []
+    for _, row in df.iterrows():
+        agency_code = int(row['행정기관코드'])
+        agency_name = str(row['행정기관']).strip()
+        agencies.add((agency_code, agency_name))
+        for y in years:
+            records.append({
+                "agency_code":  agency_code,
+                "year":         y,
+                "prev_male":    int(row[f"{y}년전년남자인구수"]),
+                "prev_female":  int(row[f"{y}년전년여자인구수"]),
+                "prev_total":   int(row[f"{y}년전년인구수합계"]),
+                "curr_male":    int(row[f"{y}년남자인구수"]),
+                "curr_female":  int(row[f"{y}년여자인구수"]),
+                "curr_total":   int(row[f"{y}년인구수합계"]),
+                "male_delta":   int(row[f"{y}년인구증감남자인구수"]),
+                "female_delta": int(row[f"{y}년인구증감여자인구수"]),
+                "total_delta":  int(row[f"{y}년인구증감합계"])
+            })
+    return pd.DataFrame(records, columns=[
+        "agency_code", "year",
+        "prev_male", "prev_female", "prev_total",
+        "curr_male", "curr_female", "curr_total",
+        "male_delta", "female_delta", "total_delta"
+    ])
+
+
+# ---------- 합성 데이터 ----------
+def make_monthly(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {
+        '행정기관코드': 4100000000 + np.arange(n) * 100,
+        '행정기관': [f" 경기도 테스트시 {i}동 " for i in range(n)],
+    }
+    for m in range(1, 13):
+        data[f"{m}월총인구수"] = rng.integers(1_000, 500_000, n)
+        data[f"{m}월세대수"] = rng.integers(500, 200_000, n)
+        data[f"{m}월세대당인구"] = rng.integers(100, 400, n) / 100
+        data[f"{m}월남자인구수"] = rng.integers(500, 250_000, n)
+        data[f"{m}월여자인구수"] = rng.integers(500, 250_000, n)
+        data[f"{m}월남여비율"] = rng.integers(80, 120, n) / 100
+    return pd.DataFrame(data)
+
+def make_yearly(n: int, years: list, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {
+        '행정기관코드': 4100000000 + np.arange(n) * 100,
+        '행정기관': [f" 경기도 테스트시 {i}동 " for i in range(n)],
+    }
+    for y in years:
+        for suffix, _ in NormPopulation.yearly_fields.values():
+            data[f"{y}{suffix}"] = rng.integers(-50_000, 500_000, n)
+    return pd.DataFrame(data)
+
+
+def best_of(func, repeat: int):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def compare(label: str, legacy, vectorized, repeat: int):
+    legacy_agencies, new_agencies = set(), set()
+    t_old, old = best_of(lambda: legacy(legacy_agencies), repeat)
+    t_new, new = best_of(lambda: vectorized(new_agencies), repeat)
+
+    same = old.to_csv(index=False) == new.to_csv(index=False) and legacy_agencies == new_agencies
+    print(f"{label:<22} {len(new):>10,}건  iterrows {t_old:8.3f}s  "
+          f"stack {t_new:8.4f}s  x{t_old / t_new:7.1f}  {'✅ 동일' if same else '❌ 불일치'}")
+    return same
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="NormPopulation Wide→Long 변환 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 3_000, 30_000],
+                        help="행정기관(행) 수 목록")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    years = [2022, 2023, 2024]
+    ok = True
+    for n in args.sizes:
+        mdf = make_monthly(n)
+        ok &= compare(f"월간 ({n:,}행)",
+                      lambda a: legacy_monthly(mdf, 2024, a),
+                      lambda a: NormPopulation.reshape_monthly(mdf, 2024, a),
+                      args.repeat)
+        ydf = make_yearly(n, years)
+        ok &= compare(f"연간 ({n:,}행)",
+                      lambda a: legacy_yearly(ydf, years, a),
+                      lambda a: NormPopulation.reshape_yearly(ydf, years, a),
+                      args.repeat)
+
+    if not ok:
+        raise SystemExit(1)
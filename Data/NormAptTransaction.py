@@ -1,96 +1,261 @@
 import pandas as pd
 import os
 import re
+import sys
+import time
 import numpy as np
 
-def preprocess_apt_csv(input_csv: str, output_csv: str, source_id: int):
-    # 1) CSV 읽기 (utf-8-sig), 모든 컬럼을 문자열로 읽어둠
-    df = pd.read_csv(input_csv, encoding='utf-8-sig', dtype=str)
+from NormCache import Manifest
+from NormIO import ParquetChunkWriter, output_path, write_parquet
+
+# 컬럼명 매핑 (buyer, seller, cancel_date 제외)
+column_map = {
+    '시군구': 'sigungu',
+    '번지': 'bunji',
+    '본번': 'main_num',
+    '부번': 'sub_num',
+    '단지명': 'apt_name',
+    '전용면적(㎡)': 'area',
+    '계약년월': 'contract_ym',
+    '계약일': 'contract_day',
+    '거래금액(만원)': 'price',
+    '동': 'dong',
+    '층': 'floor',
+    '건축년도': 'build_year',
+    '도로명': 'road_name',
+    '거래유형': 'deal_type',
+    '중개사소재지': 'realtor_area',
+    '등기일자': 'registry_date',
+    '주택유형': 'apt_type'
+}
+
+# 숫자형으로 변환하는 컬럼 (price는 쉼표 제거 후 변환)
+numeric_cols = ['price', 'area', 'contract_ym', 'contract_day', 'floor', 'build_year']
+
+# 최종 컬럼 순서 (buyer, seller, cancel_date 없음)
+final_cols = [
+    'sigungu', 'bunji', 'main_num', 'sub_num', 'apt_name', 'area',
+    'contract_ym', 'contract_day', 'price', 'dong', 'floor',
+    'build_year', 'road_name', 'deal_type', 'realtor_area',
+    'registry_date', 'apt_type', 'source_id'
+]
+
+# Parquet 출력 시 컬럼 타입 (NormIO.to_typed 사양)
+apt_dtypes = {
+    'sigungu': 'category',
+    'bunji': 'string',
+    'main_num': 'string',
+    'sub_num': 'string',
+    'apt_name': 'string',
+    'area': 'float64',
+    'contract_ym': 'Int32',
+    'contract_day': 'Int8',
+    'price': 'Int64',
+    'dong': 'string',
+    'floor': 'Int16',
+    'build_year': 'Int16',
+    'road_name': 'string',
+    'deal_type': 'category',
+    'realtor_area': 'category',
+    'registry_date': 'date',
+    'apt_type': 'category',
+    'source_id': 'Int8',
+}
+
+# 스트리밍 모드 기본 청크 크기 (행 수)
+DEFAULT_CHUNKSIZE = 100_000
+
+# 연도별 원본 파일 (year, 파일명, source_id)
+data_sources = [
+    (2022, "아파트(매매)_실거래가_202201_202212.csv", 1),
+    (2023, "아파트(매매)_실거래가_202301_202312.csv", 2),
+    (2024, "아파트(매매)_실거래가_202401_202412.csv", 3),
+]
+
+
+def parse_date(val):
+    if pd.isna(val):
+        return np.nan
+    s = str(val).strip()
+    if re.fullmatch(r'\d{8}', s):
+        return pd.to_datetime(s, format='%Y%m%d', errors='coerce').date()
+    # 혹시 'YY.MM.DD' 형태가 섞여있다면
+    return pd.to_datetime(s, format='%y.%m.%d', errors='coerce').date()
 
-    # 2) 컬럼명 매핑 (buyer, seller, cancel_date 제외)
-    column_map = {
-        '시군구': 'sigungu',
-        '번지': 'bunji',
-        '본번': 'main_num',
-        '부번': 'sub_num',
-        '단지명': 'apt_name',
-        '전용면적(㎡)': 'area',
-        '계약년월': 'contract_ym',
-        '계약일': 'contract_day',
-        '거래금액(만원)': 'price',
-        '동': 'dong',
-        '층': 'floor',
-        '건축년도': 'build_year',
-        '도로명': 'road_name',
-        '거래유형': 'deal_type',
-        '중개사소재지': 'realtor_area',
-        '등기일자': 'registry_date',
-        '주택유형': 'apt_type'
-    }
+
+def clean_apt_frame(df: pd.DataFrame, source_id: int, float_cols=None) -> pd.DataFrame:
+    """
+    원본 DataFrame(모든 컬럼 문자열)을 정제하여 final_cols 순서의 DataFrame 반환
+    - float_cols: 청크 처리 시 파일 전체 기준으로 실수형이 되는 숫자 컬럼 목록
+      (청크마다 int/float 추론이 달라져 '12'/'12.0' 출력이 섞이는 것을 방지)
+    """
+    # 1) 컬럼명 매핑
     df = df.rename(columns=column_map)
 
-    # 3) buyer, seller, cancel_date 컬럼은 아예 무시하고(컬럼명이 없으므로 자동 제거됨)
+    # 2) buyer, seller, cancel_date 컬럼은 아예 무시하고(컬럼명이 없으므로 자동 제거됨)
     df = df[list(column_map.values())].copy()
 
-    # 4) '-' 또는 빈문자열을 NaN 처리
+    # 3) '-' 또는 빈문자열을 NaN 처리
     df.replace(['-', ''], np.nan, inplace=True)
 
-    # 5) price: 쉼표 제거 후 숫자형으로 변환
+    # 4) price: 쉼표 제거 후 숫자형으로 변환
     df['price'] = df['price'].str.replace(',', '', regex=False)
-    df['price'] = pd.to_numeric(df['price'], errors='coerce')
 
-    # 6) 기타 숫자형 컬럼 처리 (area, contract_ym, contract_day, floor, build_year)
-    for col in ['area', 'contract_ym', 'contract_day', 'floor', 'build_year']:
+    # 5) 숫자형 컬럼 처리 (price, area, contract_ym, contract_day, floor, build_year)
+    for col in numeric_cols:
         df[col] = pd.to_numeric(df[col], errors='coerce')
+        if float_cols and col in float_cols:
+            df[col] = df[col].astype('float64')
 
-    # 7) 날짜 파싱: registry_date 컬럼만 남김
-    def parse_date(val):
-        if pd.isna(val):
-            return np.nan
-        s = str(val).strip()
-        if re.fullmatch(r'\d{8}', s):
-            return pd.to_datetime(s, format='%Y%m%d', errors='coerce').date()
-        # 혹시 'YY.MM.DD' 형태가 섞여있다면
-        return pd.to_datetime(s, format='%y.%m.%d', errors='coerce').date()
-
+    # 6) 날짜 파싱: registry_date 컬럼만 남김
     df['registry_date'] = df['registry_date'].apply(parse_date)
 
-    # 8) dong 칼럼이 NaN이거나 길면 먼저 NaN, 문자열일 때 최대 20자 자르기
+    # 7) dong 칼럼이 NaN이거나 길면 먼저 NaN, 문자열일 때 최대 20자 자르기
     df['dong'] = df['dong'].astype(str).str.strip()
     df.loc[df['dong'].isin(['nan', 'None']), 'dong'] = np.nan
     df['dong'] = df['dong'].str.slice(0, 20)
 
-    # 9) source_id 추가
+    # 8) source_id 추가
     df['source_id'] = source_id
 
-    # 10) 컬럼 순서 재정렬 (buyer, seller, cancel_date 없음)
-    final_cols = [
-        'sigungu', 'bunji', 'main_num', 'sub_num', 'apt_name', 'area',
-        'contract_ym', 'contract_day', 'price', 'dong', 'floor',
-        'build_year', 'road_name', 'deal_type', 'realtor_area',
-        'registry_date', 'apt_type', 'source_id'
-    ]
-    df = df[final_cols]
-
-    # 11) 모든 NaN을 '\N'으로 바꾸기 + 문자열 "nan"도 '\N' 처리
-    #     1) df.fillna(np.nan) 상태에서, 숫자/날짜 변환 실패로 생긴 NaN은 df.astype(str) 시 "nan"이 됩니다.
-    #     2) df = df.astype(str).replace({'nan':'\\N', 'NaT':'\\N'}) 통해 모두 '\N'으로 변환
-    df = df.astype(str).replace({'nan': '\\N', 'NaT': '\\N'})
-
-    # 12) CSV 저장 (이제 모든 필드에서 결측은 '\N')
+    # 9) 컬럼 순서 재정렬
+    return df[final_cols]
+
+
+def to_mysql_strings(df: pd.DataFrame) -> pd.DataFrame:
+    # 모든 NaN을 '\N'으로 바꾸기 + 문자열 "nan"도 '\N' 처리
+    #  1) 숫자/날짜 변환 실패로 생긴 NaN은 df.astype(str) 시 "nan"이 됩니다.
+    #  2) df.astype(str).replace({'nan':'\\N', 'NaT':'\\N'}) 통해 모두 '\N'으로 변환
+    return df.astype(str).replace({'nan': '\\N', 'NaT': '\\N'})
+
+
+def scan_float_cols(input_csv: str, chunksize: int) -> set:
+    """
+    숫자 컬럼만 읽어 파일 전체 기준 to_numeric 결과가 실수형이 되는 컬럼을 찾음
+    - 전체 파일 경로에서는 결측/소수가 하나라도 있으면 컬럼 전체가 float64 → '12.0'
+    - 청크별로는 결측이 없는 청크가 int64 → '12' 로 찍히므로 미리 전체 기준을 맞춰둠
+    """
+    src_cols = [k for k, v in column_map.items() if v in numeric_cols]
+    float_cols = set()
+    reader = pd.read_csv(input_csv, encoding='utf-8-sig', dtype=str,
+                         usecols=src_cols, chunksize=chunksize)
+    for chunk in reader:
+        chunk = chunk.rename(columns=column_map)
+        chunk.replace(['-', ''], np.nan, inplace=True)
+        chunk['price'] = chunk['price'].str.replace(',', '', regex=False)
+        for col in numeric_cols:
+            if col not in float_cols and pd.to_numeric(chunk[col], errors='coerce').dtype.kind == 'f':
+                float_cols.add(col)
+    return float_cols
+
+
+def peak_rss_mb():
+    # 최대 메모리 사용량(MB), resource 모듈이 없는 Windows에서는 None
+    try:
+        import resource
+    except ImportError:
+        return None
+    import sys
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def preprocess_apt_csv(input_csv: str, output_csv: str, source_id: int, chunksize: int = None,
+                       fmt: str = 'csv'):
+    """
+    실거래가 CSV 전처리
+    - chunksize 지정 시 스트리밍 모드: chunksize 행씩 읽고 정제해서 바로 이어 씀
+      (출력은 전체 로드 방식과 바이트 단위로 동일, 메모리는 청크 크기에만 비례)
+    - fmt='parquet': 문자열 변환 없이 apt_dtypes 타입 그대로 Parquet 저장
+    """
+    if chunksize:
+        return preprocess_apt_csv_streaming(input_csv, output_csv, source_id, chunksize, fmt)
+
+    # 1) CSV 읽기 (utf-8-sig), 모든 컬럼을 문자열로 읽어둠
+    df = pd.read_csv(input_csv, encoding='utf-8-sig', dtype=str)
+
+    if fmt == 'parquet':
+        df = clean_apt_frame(df, source_id)
+        write_parquet(df, output_csv, apt_dtypes)
+        print(f"✅ {os.path.basename(output_csv)} 전처리 완료 ({len(df)}건)")
+        return len(df)
+
+    # 2) 정제 + 결측을 '\N'으로
+    df = to_mysql_strings(clean_apt_frame(df, source_id))
+
+    # 3) CSV 저장 (이제 모든 필드에서 결측은 '\N')
     df.to_csv(output_csv, index=False, encoding='utf-8-sig')
     print(f"✅ {os.path.basename(output_csv)} 전처리 완료 ({len(df)}건)")
+    return len(df)
+
+
+def preprocess_apt_csv_streaming(input_csv: str, output_csv: str, source_id: int,
+                                 chunksize: int = DEFAULT_CHUNKSIZE, fmt: str = 'csv'):
+    start = time.perf_counter()
+    total = 0
+
+    if fmt == 'parquet':
+        # Parquet은 스키마가 고정이라 숫자 컬럼 사전 스캔이 필요 없음 (청크 = row group)
+        with ParquetChunkWriter(output_csv, apt_dtypes) as writer:
+            for chunk in pd.read_csv(input_csv, encoding='utf-8-sig', dtype=str, chunksize=chunksize):
+                writer.write(clean_apt_frame(chunk, source_id))
+                total += len(chunk)
+        report_streaming(output_csv, total, time.perf_counter() - start)
+        return total
+
+    # 1) 숫자 컬럼 사전 스캔 (int/float 출력 형식을 파일 전체 기준으로 고정)
+    float_cols = scan_float_cols(input_csv, chunksize)
+
+    # 2) 청크 단위로 읽기 → 정제 → 이어 쓰기
+    #    파일 핸들을 한 번만 열어야 BOM이 맨 앞에 한 번만 기록됨
+    with open(output_csv, 'w', encoding='utf-8-sig', newline='') as out:
+        reader = pd.read_csv(input_csv, encoding='utf-8-sig', dtype=str, chunksize=chunksize)
+        for chunk in reader:
+            chunk = to_mysql_strings(clean_apt_frame(chunk, source_id, float_cols))
+            chunk.to_csv(out, index=False, header=(total == 0))
+            total += len(chunk)
+
+        # 데이터 행이 없는 파일도 헤더는 남김
+        if total == 0:
+            pd.DataFrame(columns=final_cols).to_csv(out, index=False)
+
+    report_streaming(output_csv, total, time.perf_counter() - start)
+    return total
+
+def report_streaming(path: str, total: int, elapsed: float):
+    rate = total / elapsed if elapsed > 0 else float('inf')
+    rss = peak_rss_mb()
+    rss_msg = f", peak RSS {rss:.0f}MB" if rss is not None else ""
+    print(f"✅ {os.path.basename(path)} 스트리밍 전처리 완료 ({total}건, "
+          f"{elapsed:.1f}s, {rate:,.0f} rows/s{rss_msg})")
+
+def cache_config(source_id: int, fmt: str = 'csv') -> dict:
+    # 출력에 영향을 주는 설정 (바뀌면 재처리)
+    config = {"column_map": column_map, "final_cols": final_cols, "source_id": source_id}
+    if fmt == 'parquet':
+        config["dtypes"] = apt_dtypes
+    return config
 
 # 사용 예시
 if __name__ == "__main__":
     base_path = r"C:\ajouDatabaseProject\Data"
-    data_sources = [
-        (2022, "아파트(매매)_실거래가_202201_202212.csv", 1),
-        (2023, "아파트(매매)_실거래가_202301_202312.csv", 2),
-        (2024, "아파트(매매)_실거래가_202401_202412.csv", 3),
-    ]
+    force = '--force' in sys.argv
+    fmt = 'parquet' if '--parquet' in sys.argv else 'csv'
+    manifest = Manifest(base_path)
 
     for year, fname, src_id in data_sources:
         inp = os.path.join(base_path, fname)
-        out = os.path.join(base_path, f"AptTransaction_{year}_preprocessed.csv")
-        preprocess_apt_csv(inp, out, src_id)
+        out = output_path(os.path.join(base_path, f"AptTransaction_{year}_preprocessed.csv"), fmt)
+        key = f"AptTransaction_{year}" + ("" if fmt == 'csv' else f".{fmt}")
+        config = cache_config(src_id, fmt)
+
+        # 입력/설정/코드가 그대로면 건너뜀
+        if not force and manifest.is_fresh(key, [inp], [out], config, __file__):
+            print(f"⏭️ {os.path.basename(out)} 변경 없음, 건너뜀")
+            continue
+
+        # 전국 단위 대용량 파일은 스트리밍 모드로 (메모리 사용량 일정)
+        preprocess_apt_csv(inp, out, src_id, chunksize=DEFAULT_CHUNKSIZE, fmt=fmt)
+        manifest.record(key, [inp], [out], config, __file__)
+        manifest.save()
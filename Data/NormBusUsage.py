@@ -1,20 +1,44 @@
 import pandas as pd
 import os
+import sys
 
-def preprocess_bus_usage(input_csv: str, output_csv: str):
+from NormCache import Manifest
+from NormIO import output_path, write_parquet
+
+# 연도별 CSV 파일 매핑
+bus_files = {
+    2022: "정류소간 버스 이용객수_2022.csv",
+    2023: "정류소간 버스 이용객수_2023.csv"
+}
+
+# 원본 → 전처리 컬럼명 (manifest 설정 해시에도 사용)
+bus_column_map = {
+    '기점': 'dep',
+    '종점': 'arr',
+    '연도': 'year',
+    '월': 'month',
+    '일시': 'day_type',
+    '수단': 'transport_type',
+    '이용객수': 'usage_cnt'
+}
+
+# Parquet 출력 시 컬럼 타입 (NormIO.to_typed 사양)
+bus_dtypes = {
+    'dep': 'category',
+    'arr': 'category',
+    'year': 'Int16',
+    'month': 'Int8',
+    'day_type': 'category',
+    'transport_type': 'category',
+    'usage_cnt': 'Int64',
+}
+
+def preprocess_bus_usage(input_csv: str, output_csv: str, fmt: str = 'csv'):
     # 1) CSV 읽기
     df = pd.read_csv(input_csv, encoding='utf-8-sig')
 
     # 2) 컬럼명 변환
-    df = df.rename(columns={
-        '기점': 'dep',
-        '종점': 'arr',
-        '연도': 'year',
-        '월': 'month',
-        '일시': 'day_type',
-        '수단': 'transport_type',
-        '이용객수': 'usage_cnt'
-    })
+    df = df.rename(columns=bus_column_map)
 
     # 3) 결측치/데이터 타입 처리
     df = df.fillna('')
@@ -22,22 +46,30 @@ def preprocess_bus_usage(input_csv: str, output_csv: str):
     df['month'] = df['month'].astype(int)
     df['usage_cnt'] = pd.to_numeric(df['usage_cnt'], errors='coerce').fillna(0).astype(int)
 
-    # 4) 저장 (MySQL에서 \N을 NULL로 인식하도록 설정)
-    df.to_csv(output_csv, index=False, encoding='utf-8-sig', na_rep='\\N')
+    # 4) 저장 (CSV: MySQL에서 \N을 NULL로 인식하도록 설정 / Parquet: 타입 그대로)
+    if fmt == 'parquet':
+        write_parquet(df, output_csv, bus_dtypes)
+    else:
+        df.to_csv(output_csv, index=False, encoding='utf-8-sig', na_rep='\\N')
     print(f"✅ {os.path.basename(output_csv)} 전처리 완료, {len(df)}건")
+    return len(df)
 
 
 if __name__ == "__main__":
     base = r"C:\ajouDatabaseProject\Data"
+    force = '--force' in sys.argv
+    fmt = 'parquet' if '--parquet' in sys.argv else 'csv'
+    config = dict(bus_column_map, dtypes=bus_dtypes) if fmt == 'parquet' else bus_column_map
+    manifest = Manifest(base)
 
-    # 연도별 CSV 파일 매핑
-    files = {
-        2022: "정류소간 버스 이용객수_2022.csv",
-        2023: "정류소간 버스 이용객수_2023.csv"
-    }
-
-    # 연도별 처리
-    for year, filename in files.items():
+    # 연도별 처리 (입력/설정/코드가 그대로면 건너뜀)
+    for year, filename in bus_files.items():
         input_csv  = os.path.join(base, filename)
-        output_csv = os.path.join(base, f"BusUsage_{year}_preprocessed.csv")
-        preprocess_bus_usage(input_csv, output_csv)
+        output_csv = output_path(os.path.join(base, f"BusUsage_{year}_preprocessed.csv"), fmt)
+        key = f"BusUsage_{year}" + ("" if fmt == 'csv' else f".{fmt}")
+        if not force and manifest.is_fresh(key, [input_csv], [output_csv], config, __file__):
+            print(f"⏭️ {os.path.basename(output_csv)} 변경 없음, 건너뜀")
+            continue
+        preprocess_bus_usage(input_csv, output_csv, fmt)
+        manifest.record(key, [input_csv], [output_csv], config, __file__)
+        manifest.save()
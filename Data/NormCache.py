@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+
+# ========================================
+# NormCache.py
+#  전처리 결과 재사용을 위한 해시 manifest (.norm_manifest.json)
+# ========================================
+
+    # - 작업(key)마다 입력 파일 해시 / 설정(config) 해시 / 코드(스크립트) 해시를 기록
+    # - 세 값이 모두 같고 출력 파일이 존재하면 재처리 생략
+    # - 파일 해시는 (크기, 수정시각)이 같으면 저장된 값을 재사용 → 변경 없는 재실행은 stat만 수행
+    # - meta: 작업별 부가 결과 저장용 (예: NormPopulation의 Agency 목록)
+
+MANIFEST_NAME = ".norm_manifest.json"
+
+
+def sha256_file(path: str, block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def config_hash(config) -> str:
+    # dict/list 설정을 정렬된 JSON으로 직렬화해 해시
+    text = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class Manifest:
+    def __init__(self, base_dir: str, name: str = MANIFEST_NAME):
+        self.path = os.path.join(base_dir, name)
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        self.files = data.get("files", {})
+        self.jobs = data.get("jobs", {})
+
+    def file_hash(self, path: str) -> str:
+        """(크기, mtime)이 기록과 같으면 저장된 해시 사용, 다르면 새로 계산"""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        cached = self.files.get(path)
+        if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached["sha256"]
+        digest = sha256_file(path)
+        self.files[path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        return digest
+
+    def fingerprint(self, inputs: list, config=None, code: str = None) -> dict:
+        return {
+            "inputs": {os.path.basename(p): self.file_hash(p) for p in inputs},
+            "config": config_hash(config),
+            "code": self.file_hash(code) if code else None,
+        }
+
+    def is_fresh(self, key: str, inputs: list, outputs: list, config=None, code: str = None) -> bool:
+        entry = self.jobs.get(key)
+        if not entry or not all(os.path.exists(p) for p in outputs):
+            return False
+        if not all(os.path.exists(p) for p in inputs):
+            return False
+        return entry["fingerprint"] == self.fingerprint(inputs, config, code)
+
+    def record(self, key: str, inputs: list, outputs: list, config=None, code: str = None, meta=None):
+        self.jobs[key] = {
+            "fingerprint": self.fingerprint(inputs, config, code),
+            "outputs": [os.path.basename(p) for p in outputs],
+            "meta": meta,
+        }
+        # 출력 파일도 stat 캐시에 넣어 다음 단계의 입력으로 쓰일 때 재해시하지 않도록 함
+        for p in outputs:
+            if os.path.exists(p):
+                self.file_hash(p)
+
+    def meta(self, key: str):
+        entry = self.jobs.get(key)
+        return entry.get("meta") if entry else None
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"files": self.files, "jobs": self.jobs}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
@@ -0,0 +1,94 @@
+import os
+
+import pandas as pd
+
+# ========================================
+# NormIO.py
+#  전처리 결과 저장: 기존 '\N' CSV 외에 타입이 있는 Parquet 출력 지원
+# ========================================
+
+    # - dtypes 사양: 컬럼명 → 'Int64' / 'Int16' / 'Int8' / 'float64' / 'string' / 'category' / 'date'
+    #   * Int*: 결측 허용 정수 (CSV의 '\N' 대신 null)
+    #   * category: 시군구·거래유형처럼 반복이 많은 문자열 (Parquet dictionary 인코딩)
+    #   * date: DATE (등기일자 등)
+    # - 빈 문자열은 null로 저장 (CSV를 다시 읽을 때 NaN이 되는 것과 동일)
+    # - pyarrow는 Parquet 출력 시에만 import
+
+FORMATS = ('csv', 'parquet')
+
+
+def output_path(csv_path: str, fmt: str) -> str:
+    # 'xxx.csv' → 'xxx.parquet'
+    if fmt == 'parquet':
+        return os.path.splitext(csv_path)[0] + '.parquet'
+    return csv_path
+
+
+def to_typed(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """dtypes 사양대로 컬럼 타입 변환 (컬럼 순서도 사양 순서로)"""
+    out = {}
+    for col, kind in dtypes.items():
+        s = df[col]
+        if kind == 'date':
+            s = pd.to_datetime(s, errors='coerce')
+        elif kind in ('string', 'category'):
+            s = s.astype('string').replace('', pd.NA)
+            if kind == 'category':
+                s = s.astype('category')
+        else:
+            s = pd.to_numeric(s, errors='coerce').astype(kind)
+        out[col] = s
+    return pd.DataFrame(out)
+
+
+def arrow_schema(dtypes: dict):
+    import pyarrow as pa
+
+    mapping = {
+        'Int64': pa.int64(),
+        'Int32': pa.int32(),
+        'Int16': pa.int16(),
+        'Int8': pa.int8(),
+        'float64': pa.float64(),
+        'string': pa.string(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'date': pa.date32(),
+    }
+    return pa.schema([(col, mapping[kind]) for col, kind in dtypes.items()])
+
+
+def to_arrow(df: pd.DataFrame, dtypes: dict = None):
+    import pyarrow as pa
+
+    if dtypes is None:
+        # 사양이 없는 상세 테이블 등은 pandas 타입 추론 결과를 그대로 사용
+        return pa.Table.from_pandas(df.convert_dtypes(), preserve_index=False)
+    return pa.Table.from_pandas(to_typed(df, dtypes), schema=arrow_schema(dtypes), preserve_index=False)
+
+
+def write_parquet(df: pd.DataFrame, path: str, dtypes: dict = None):
+    import pyarrow.parquet as pq
+
+    pq.write_table(to_arrow(df, dtypes), path, compression='zstd')
+
+
+class ParquetChunkWriter:
+    """스트리밍 전처리용: 청크마다 row group 하나씩 추가 (스키마는 dtypes 사양으로 고정)"""
+
+    def __init__(self, path: str, dtypes: dict):
+        import pyarrow.parquet as pq
+
+        self.dtypes = dtypes
+        self.writer = pq.ParquetWriter(path, arrow_schema(dtypes), compression='zstd')
+
+    def write(self, df: pd.DataFrame):
+        self.writer.write_table(to_arrow(df, self.dtypes))
+
+    def close(self):
+        self.writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
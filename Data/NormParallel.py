@@ -0,0 +1,198 @@
+import argparse
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import NormAptTransaction
+import NormBusUsage
+import NormHospital
+import NormPopulation
+import NormSoc
+from NormCache import Manifest
+from NormIO import FORMATS, output_path
+
+# ========================================
+# NormParallel.py
+#  연도별 전처리 작업(실거래가 / 버스 / 인구) + SOC/병원을 프로세스 풀에서 병렬 실행
+# ========================================
+
+    # - 연도별 입력 파일은 서로 독립 → 파일 하나 = 작업 하나
+    # - 큰 파일부터 제출: 가장 오래 걸리는 작업이 먼저 시작되어 전체 시간 ≈ 가장 느린 파일
+    # - 작업 결과(건수, 오류, 소요시간)를 모아 요약 출력
+    # - NormPopulation의 Agency 정보는 작업마다 별도 세트로 수집 후 부모 프로세스에서 병합
+    #   (워커 프로세스의 전역 agency_records는 부모와 공유되지 않음)
+    # - NormCache manifest로 입력/설정/코드가 그대로인 작업은 제출하지 않음
+    #   (모두 최신이면 프로세스 풀도 만들지 않음)
+
+
+def build_jobs(base_dir: str, apt_chunksize: int = None, fmt: str = 'csv'):
+    """작업 목록 생성: key(manifest 키), 실행할 함수, 입력/출력 경로, 설정"""
+    jobs = []
+
+    # 1) 실거래가
+    for year, fname, src_id in NormAptTransaction.data_sources:
+        inp = os.path.join(base_dir, fname)
+        out = output_path(os.path.join(base_dir, f"AptTransaction_{year}_preprocessed.csv"), fmt)
+        jobs.append({
+            "key": f"AptTransaction_{year}", "module": NormAptTransaction, "func": "preprocess_apt_csv",
+            "inputs": [inp], "outputs": [out], "config": NormAptTransaction.cache_config(src_id, fmt),
+            "args": (inp, out, src_id), "kwargs": {"chunksize": apt_chunksize, "fmt": fmt},
+        })
+
+    # 2) 버스 이용객수
+    for year, fname in NormBusUsage.bus_files.items():
+        inp = os.path.join(base_dir, fname)
+        out = output_path(os.path.join(base_dir, f"BusUsage_{year}_preprocessed.csv"), fmt)
+        jobs.append({
+            "key": f"BusUsage_{year}", "module": NormBusUsage, "func": "preprocess_bus_usage",
+            "inputs": [inp], "outputs": [out],
+            "config": dict(NormBusUsage.bus_column_map, dtypes=NormBusUsage.bus_dtypes) if fmt == 'parquet'
+                      else NormBusUsage.bus_column_map,
+            "args": (inp, out), "kwargs": {"fmt": fmt},
+        })
+
+    # 3) 인구 (월간 + 연간) - agencies 세트는 워커에서 새로 만들어 결과로 반환
+    def pop_config(config):
+        return dict(config, format=fmt) if fmt == 'parquet' else config
+
+    for year, fname in NormPopulation.monthly_files.items():
+        inp = os.path.join(base_dir, fname)
+        out = output_path(os.path.join(base_dir, f"PopulationMonthly_{year}_preprocessed.csv"), fmt)
+        jobs.append({
+            "key": f"PopulationMonthly_{year}", "module": NormPopulation, "func": "preprocess_population_monthly",
+            "inputs": [inp], "outputs": [out], "config": pop_config({"fields": NormPopulation.monthly_fields, "year": year}),
+            "args": (inp, out, year), "kwargs": {"agencies": None, "fmt": fmt},
+        })
+
+    inp = os.path.join(base_dir, NormPopulation.annual_fname)
+    out = output_path(os.path.join(base_dir, "PopulationYearly_preprocessed.csv"), fmt)
+    jobs.append({
+        "key": "PopulationYearly", "module": NormPopulation, "func": "preprocess_population_yearly",
+        "inputs": [inp], "outputs": [out], "config": pop_config({"fields": NormPopulation.yearly_fields}),
+        "args": (inp, out), "kwargs": {"agencies": None, "fmt": fmt},
+    })
+
+    # 4) SOC 7종 (한 작업에서 FacilityBase + 상세 7개 생성)
+    soc_config = {"soc_files": NormSoc.soc_files, "base_cols": NormSoc.base_cols}
+    if fmt == 'parquet':
+        soc_config["dtypes"] = NormSoc.facility_base_dtypes
+    jobs.append({
+        "key": "Soc", "module": NormSoc, "func": "preprocess_soc",
+        "inputs": [os.path.join(base_dir, cfg['file']) for cfg in NormSoc.soc_files.values()],
+        "outputs": NormSoc.soc_outputs(base_dir, fmt),
+        "config": soc_config,
+        "args": (base_dir,), "kwargs": {"fmt": fmt},
+    })
+
+    # 5) 병원
+    inp = os.path.join(base_dir, '경기도병원현황.csv')
+    out = output_path(os.path.join(base_dir, 'Hospital.csv'), fmt)
+    jobs.append({
+        "key": "Hospital", "module": NormHospital, "func": "preprocess_hospital",
+        "inputs": [inp], "outputs": [out], "config": NormHospital.rename_map,
+        "args": (inp, out), "kwargs": {"fmt": fmt},
+    })
+
+    # Parquet 작업은 CSV 작업과 별도 키로 기록 (설정은 각 스크립트의 __main__과 동일)
+    if fmt != 'csv':
+        for job in jobs:
+            job["key"] += f".{fmt}"
+    return jobs
+
+
+def run_job(job):
+    """워커 프로세스에서 실행: 예외는 잡아서 결과로 돌려줌"""
+    kwargs = dict(job["kwargs"])
+    if "agencies" in kwargs:
+        kwargs["agencies"] = set()
+
+    start = time.perf_counter()
+    try:
+        missing = [p for p in job["inputs"] if not os.path.exists(p)]
+        if missing:
+            raise FileNotFoundError(", ".join(missing))
+        func = getattr(importlib.import_module(job["module"]), job["func"])
+        rows = func(*job["args"], **kwargs)
+        error = None
+    except Exception as ex:
+        rows = 0
+        error = f"{type(ex).__name__}: {ex}"
+
+    return {
+        "key": job["key"],
+        "rows": rows or 0,
+        "error": error,
+        "seconds": time.perf_counter() - start,
+        "agencies": kwargs.get("agencies") or set(),
+    }
+
+
+def run_all(base_dir: str, max_workers: int = None, apt_chunksize: int = None, force: bool = False,
+            fmt: str = 'csv'):
+    start = time.perf_counter()
+    manifest = Manifest(base_dir)
+    jobs = build_jobs(base_dir, apt_chunksize, fmt)
+
+    # 변경 없는 작업 제외 (인구 작업의 Agency 목록은 manifest에서 복원)
+    agencies = set()
+    pending = []
+    for job in jobs:
+        code = job["module"].__file__
+        if not force and manifest.is_fresh(job["key"], job["inputs"], job["outputs"], job["config"], code):
+            if "agencies" in job["kwargs"]:
+                agencies.update(tuple(a) for a in manifest.meta(job["key"]) or [])
+            continue
+        # 워커에는 모듈 객체 대신 모듈명을 넘김 (pickle 가능하도록)
+        pending.append(dict(job, module=job["module"].__name__, code=code))
+
+    # 큰 입력부터 제출 (누락 파일은 크기 0)
+    pending.sort(key=lambda j: sum(os.path.getsize(p) for p in j["inputs"] if os.path.exists(p)), reverse=True)
+
+    results = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(max_workers or os.cpu_count(), len(pending))) as pool:
+            futures = {pool.submit(run_job, job): job for job in pending}
+            for fut in as_completed(futures):
+                job, res = futures[fut], fut.result()
+                agencies |= res["agencies"]
+                results.append(res)
+                if res["error"] is None:
+                    meta = sorted(res["agencies"]) if "agencies" in job["kwargs"] else None
+                    manifest.record(job["key"], job["inputs"], job["outputs"], job["config"], job["code"], meta=meta)
+
+    # Agency 테이블용 CSV: 모든 인구 작업의 결과를 병합해서 한 번만 저장 (목록이 바뀐 경우에만)
+    agency_out = output_path(os.path.join(base_dir, "Agency_preprocessed.csv"), fmt)
+    agency_key = "Agency" + ("" if fmt == 'csv' else f".{fmt}")
+    agency_config = sorted(agencies)
+    if agencies and (force or not manifest.is_fresh(agency_key, [], [agency_out], agency_config, NormPopulation.__file__)):
+        NormPopulation.write_agency_csv(agencies, agency_out, fmt)
+        manifest.record(agency_key, [], [agency_out], agency_config, NormPopulation.__file__)
+    manifest.save()
+    elapsed = time.perf_counter() - start
+
+    # 요약 출력
+    print("=== 전처리 결과 요약 ===")
+    for res in sorted(results, key=lambda r: r["key"]):
+        status = "✅" if res["error"] is None else f"❌ {res['error']}"
+        print(f"{res['key']:<24} {res['rows']:>10,}건 {res['seconds']:>7.1f}s  {status}")
+    print(f"변경 없음(건너뜀) {len(jobs) - len(pending)}개 작업")
+    slowest = max((r["seconds"] for r in results), default=0.0)
+    print(f"전체 {elapsed:.2f}s (가장 느린 작업 {slowest:.1f}s)")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전처리 작업 병렬 실행")
+    parser.add_argument("--base-dir", default=r"C:\ajouDatabaseProject\Data")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--apt-chunksize", type=int, default=NormAptTransaction.DEFAULT_CHUNKSIZE,
+                        help="실거래가 스트리밍 청크 크기 (0이면 전체 로드)")
+    parser.add_argument("--force", action="store_true", help="manifest 무시하고 전부 다시 처리")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="출력 형식 (parquet: 타입 유지)")
+    args = parser.parse_args()
+
+    results = run_all(args.base_dir, args.workers, args.apt_chunksize or None, args.force, args.format)
+    if any(r["error"] for r in results):
+        raise SystemExit(1)
@@ -1,6 +1,11 @@
 import pandas as pd
+import numpy as np
 import os
 import re
+import sys
+
+from NormCache import Manifest
+import NormIO
 
 # ========================================
 # NormPopulation.py
@@ -11,10 +16,10 @@ import re
     #   * thousands=',': 천단위 구분자 콤마 제거 후 숫자 파싱
     #   * encoding: 한글 인코딩 호환
     # - clean_columns: 컬럼명 BOM(\ufeff)·공백 제거
-    # - Wide→Long 변환:
-    #   * df.iterrows(): 한 행씩 순회
-    #   * for m in range(1,13): 월별 컬럼 추출하여 리스트(records)에 append
-    #   * 결과: 행×월 개수 만큼 레코드 생성
+    # - Wide→Long 변환 (열 단위, 행 순회 없음):
+    #   * 필드마다 1~12월 컬럼을 (행 × 월) 2차원 배열로 뽑아 ravel()로 펼침
+    #   * agency_code는 np.repeat, month는 np.tile로 같은 순서에 맞춤
+    #   * 결과: 행×월 개수 만큼 레코드 생성 (BenchNormPopulation.py로 기존 iterrows 방식과 비교)
     # - agency_records(set): 중복 기관명 제거용
     # - to_csv: index=False로 pandas 인덱스 제거, utf-8-sig로 BOM 포함
     # - print: 처리 건수로 데이터 적재 전 검증 가능
@@ -22,140 +27,222 @@ import re
     
     
 # 전역 세트: Agency 테이블용 (code, name) 정보 수집
+#  - 병렬 실행(NormParallel.py) 시에는 작업마다 agencies 인자로 별도 세트를 넘겨 받아 병합
 agency_records = set()
 
+# 연도별 월간 원본 파일
+monthly_files = {
+    2022: "202201_202212_주민등록인구및세대현황_월간.csv",
+    2023: "202301_202312_주민등록인구및세대현황_월간.csv",
+    2024: "202401_202412_주민등록인구및세대현황_월간.csv"
+}
+
+# 연간(인구증감) 원본 파일
+annual_fname = "202212_202412_주민등록인구기타현황(인구증감)_연간.csv"
+
 def clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     # 헤더(컬럼명) 정리: BOM 제거, 앞뒤 공백(strip) 제거
     df.columns = df.columns.str.replace('\ufeff', '', regex=False).str.strip()
     return df
 
-def preprocess_population_monthly(input_path: str, output_path: str, year: int):
-    """
-    월간 인구 통계 CSV를 Long 포맷으로 변환하고 Agency 정보 수집
-    - Wide 형태를 Long 형태로 전개
-    - 데이터 건수 출력
-    """
-    # 1) CSV 로드: UTF-8 BOM 포함 시도, 실패 시 EUC-KR
+# 월간: 출력 컬럼 → (원본 컬럼 접미사, dtype)   예) "1월총인구수"
+monthly_fields = {
+    "total_pop":         ("월총인구수", "int64"),
+    "household":         ("월세대수", "int64"),
+    "pop_per_household": ("월세대당인구", "float64"),
+    "male":              ("월남자인구수", "int64"),
+    "female":            ("월여자인구수", "int64"),
+    "ratio":             ("월남여비율", "float64"),
+}
+
+# 연간: 출력 컬럼 → (원본 컬럼 접미사, dtype)   예) "2022년전년남자인구수"
+yearly_fields = {
+    "prev_male":    ("년전년남자인구수", "int64"),
+    "prev_female":  ("년전년여자인구수", "int64"),
+    "prev_total":   ("년전년인구수합계", "int64"),
+    "curr_male":    ("년남자인구수", "int64"),
+    "curr_female":  ("년여자인구수", "int64"),
+    "curr_total":   ("년인구수합계", "int64"),
+    "male_delta":   ("년인구증감남자인구수", "int64"),
+    "female_delta": ("년인구증감여자인구수", "int64"),
+    "total_delta":  ("년인구증감합계", "int64"),
+}
+
+# Parquet 출력 시 컬럼 타입 (NormIO.to_typed 사양)
+monthly_dtypes = {
+    "agency_code": "Int64", "year": "Int16", "month": "Int8",
+    "total_pop": "Int64", "household": "Int64", "pop_per_household": "float64",
+    "male": "Int64", "female": "Int64", "ratio": "float64",
+}
+yearly_dtypes = dict(
+    {"agency_code": "Int64", "year": "Int16"},
+    **{name: "Int64" for name in yearly_fields}
+)
+agency_dtypes = {"agency_code": "Int64", "name": "string"}
+
+def save_output(df: pd.DataFrame, path: str, fmt: str, dtypes: dict):
+    # CSV: 인덱스 제외, UTF-8 BOM 포함 / Parquet: 타입 그대로
+    if fmt == 'parquet':
+        NormIO.write_parquet(df, path, dtypes)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+def read_population_csv(input_path: str) -> pd.DataFrame:
+    # CSV 로드: UTF-8 BOM 포함 시도, 실패 시 EUC-KR
     try:
         df = pd.read_csv(input_path, encoding='utf-8-sig', thousands=',')
     except UnicodeDecodeError:
         df = pd.read_csv(input_path, encoding='euc-kr', thousands=',')
-    # 2) 헤더 정리
-    df = clean_columns(df)
-
-    records = []
-    # 각 행(Row) 처리: 한 행정기관의 월별 데이터
-    for _, row in df.iterrows():
-        agency_code = int(row['행정기관코드'])
-        agency_name = str(row['행정기관']).strip()
-        # Agency 정보 수집 (set으로 중복 제거)
-        agency_records.add((agency_code, agency_name))
-
-        # 각 월(1~12) 순회하여 레코드 생성
-        for m in range(1, 13):
-            records.append({
-                "agency_code":       agency_code,
-                "year":              year,
-                "month":             m,
-                "total_pop":         int(row[f"{m}월총인구수"]),
-                "household":         int(row[f"{m}월세대수"]),
-                "pop_per_household": float(row[f"{m}월세대당인구"]),
-                "male":              int(row[f"{m}월남자인구수"]),
-                "female":            int(row[f"{m}월여자인구수"]),
-                "ratio":             float(row[f"{m}월남여비율"]),
-            })
-
-    # DataFrame 생성
-    pdf = pd.DataFrame(records, columns=[
+    # 헤더 정리
+    return clean_columns(df)
+
+def collect_agencies(df: pd.DataFrame, agencies: set):
+    # (행정기관코드, 행정기관명) 중복 제거 후 한 번에 세트에 추가
+    codes = df['행정기관코드'].to_numpy(dtype='int64')
+    names = df['행정기관'].astype(str).str.strip()
+    pairs = pd.DataFrame({"code": codes, "name": names.to_numpy()}).drop_duplicates()
+    agencies.update(zip(pairs["code"].tolist(), pairs["name"].tolist()))
+    return codes
+
+def stack_wide(df: pd.DataFrame, codes, keys: list, fields: dict, key_name: str) -> dict:
+    """
+    Wide → Long 열 단위 변환
+    - 필드마다 (행 수 × 반복 수) 2차원 배열을 만들고 ravel()로 펼침
+    - 행 우선(row-major) 순서라 '행 → 월(또는 연도)' 순서가 iterrows 결과와 동일
+    """
+    n, k = len(df), len(keys)
+    out = {
+        "agency_code": np.repeat(codes, k),
+        key_name:      np.tile(np.asarray(keys, dtype='int64'), n),
+    }
+    for name, (suffix, dtype) in fields.items():
+        cols = [f"{key}{suffix}" for key in keys]
+        out[name] = df[cols].to_numpy(dtype=dtype).ravel()
+    return out
+
+def reshape_monthly(df: pd.DataFrame, year: int, agencies: set) -> pd.DataFrame:
+    # 한 행정기관의 1~12월 데이터를 12개 레코드로 전개
+    codes = collect_agencies(df, agencies)
+    months = list(range(1, 13))
+    cols = stack_wide(df, codes, months, monthly_fields, "month")
+    cols["year"] = np.full(len(df) * len(months), year, dtype='int64')
+    return pd.DataFrame(cols, columns=[
         "agency_code", "year", "month", "total_pop",
         "household", "pop_per_household", "male", "female", "ratio"
     ])
+
+def reshape_yearly(df: pd.DataFrame, years: list, agencies: set) -> pd.DataFrame:
+    # 한 행(Row)에는 3년치 데이터가 함께 존재 → 연도별 레코드로 전개
+    codes = collect_agencies(df, agencies)
+    cols = stack_wide(df, codes, years, yearly_fields, "year")
+    return pd.DataFrame(cols, columns=[
+        "agency_code", "year",
+        "prev_male", "prev_female", "prev_total",
+        "curr_male", "curr_female", "curr_total",
+        "male_delta", "female_delta", "total_delta"
+    ])
+
+def preprocess_population_monthly(input_path: str, output_path: str, year: int, agencies: set = None,
+                                  fmt: str = 'csv'):
+    """
+    월간 인구 통계 CSV를 Long 포맷으로 변환하고 Agency 정보 수집
+    - Wide 형태를 Long 형태로 전개
+    - 데이터 건수 출력
+    - agencies: Agency 정보를 모을 세트 (기본값: 전역 agency_records)
+    - fmt: 'csv' 또는 'parquet'
+    """
+    if agencies is None:
+        agencies = agency_records
+
+    df = read_population_csv(input_path)
+    pdf = reshape_monthly(df, year, agencies)
+
     # 처리 건수 로그
     print(f"🔄 월간({year}) 레코드 생성: {len(pdf)}건")
-    # CSV 저장: 인덱스 제외, UTF-8 BOM 포함
-    pdf.to_csv(output_path, index=False, encoding='utf-8-sig')
+    # 저장
+    save_output(pdf, output_path, fmt, monthly_dtypes)
     print(f"✅ 월간 전처리 완료: {output_path}\n")
+    return len(pdf)
 
-def preprocess_population_yearly(input_path: str, output_path: str, years=None):
+def preprocess_population_yearly(input_path: str, output_path: str, years=None, agencies: set = None,
+                                 fmt: str = 'csv'):
     """
     연간 인구 변화 CSV를 Long 포맷으로 변환하고 Agency 정보 수집
     - Wide 형태를 Long 형태로 전개
     - 데이터 건수 출력
+    - agencies: Agency 정보를 모을 세트 (기본값: 전역 agency_records)
+    - fmt: 'csv' 또는 'parquet'
     """
+    if agencies is None:
+        agencies = agency_records
     if years is None:
         years = [2022, 2023, 2024]
 
-    try:
-        df = pd.read_csv(input_path, encoding='utf-8-sig', thousands=',')
-    except UnicodeDecodeError:
-        df = pd.read_csv(input_path, encoding='euc-kr', thousands=',')
-    df = clean_columns(df)
-
-    records = []
-    # 한 행(Row)에는 3년치 데이터가 함께 존재
-    for _, row in df.iterrows():
-        agency_code = int(row['행정기관코드'])
-        agency_name = str(row['행정기관']).strip()
-        agency_records.add((agency_code, agency_name))
-
-        for y in years:
-            records.append({
-                "agency_code":  agency_code,
-                "year":         y,
-                "prev_male":    int(row[f"{y}년전년남자인구수"]),
-                "prev_female":  int(row[f"{y}년전년여자인구수"]),
-                "prev_total":   int(row[f"{y}년전년인구수합계"]),
-                "curr_male":    int(row[f"{y}년남자인구수"]),
-                "curr_female":  int(row[f"{y}년여자인구수"]),
-                "curr_total":   int(row[f"{y}년인구수합계"]),
-                "male_delta":   int(row[f"{y}년인구증감남자인구수"]),
-                "female_delta": int(row[f"{y}년인구증감여자인구수"]),
-                "total_delta":  int(row[f"{y}년인구증감합계"])
-            })
-
-    ydf = pd.DataFrame(records, columns=[
-        "agency_code", "year",
-        "prev_male", "prev_female", "prev_total",
-        "curr_male", "curr_female", "curr_total",
-        "male_delta", "female_delta", "total_delta"
-    ])
+    df = read_population_csv(input_path)
+    ydf = reshape_yearly(df, years, agencies)
+
     print(f"🔄 연간 레코드 생성: {len(ydf)}건")
-    ydf.to_csv(output_path, index=False, encoding='utf-8-sig')
+    save_output(ydf, output_path, fmt, yearly_dtypes)
     print(f"✅ 연간 전처리 완료: {output_path}\n")
+    return len(ydf)
+
+def write_agency_csv(records, output_path: str, fmt: str = 'csv'):
+    """(code, name) 세트를 정렬하여 Agency 테이블용 CSV(또는 Parquet)로 저장"""
+    agency_df = pd.DataFrame(sorted(records), columns=["agency_code", "name"])
+    save_output(agency_df, output_path, fmt, agency_dtypes)
+    print(f"✅ {os.path.basename(output_path)} 생성 완료 ({len(agency_df)}건)\n")
+    return len(agency_df)
 
 if __name__ == "__main__":
     # 데이터 디렉터리 설정
     base_dir = r"C:\ajouDatabaseProject\Data"
     os.makedirs(base_dir, exist_ok=True)
+    force = '--force' in sys.argv
+    fmt = 'parquet' if '--parquet' in sys.argv else 'csv'
+    suffix = "" if fmt == 'csv' else f".{fmt}"
+    manifest = Manifest(base_dir)
+
+    # 건너뛴 작업의 Agency 정보는 manifest에 저장해 둔 목록으로 복원
+    def run_cached(key, in_path, out_path, config, func, *args):
+        if fmt == 'parquet':
+            config = dict(config, format=fmt)
+        if not force and manifest.is_fresh(key, [in_path], [out_path], config, __file__):
+            agency_records.update(tuple(a) for a in manifest.meta(key) or [])
+            print(f"⏭️ {os.path.basename(out_path)} 변경 없음, 건너뜀")
+            return
+        found = set()
+        func(in_path, out_path, *args, agencies=found, fmt=fmt)
+        agency_records.update(found)
+        manifest.record(key, [in_path], [out_path], config, __file__, meta=sorted(found))
+        manifest.save()
 
     # 1) 월간 데이터 전처리
-    monthly_files = {
-        2022: "202201_202212_주민등록인구및세대현황_월간.csv",
-        2023: "202301_202312_주민등록인구및세대현황_월간.csv",
-        2024: "202401_202412_주민등록인구및세대현황_월간.csv"
-    }
     for year, fname in monthly_files.items():
         in_path = os.path.join(base_dir, fname)
-        out_path = os.path.join(base_dir, f"PopulationMonthly_{year}_preprocessed.csv")
+        out_path = NormIO.output_path(os.path.join(base_dir, f"PopulationMonthly_{year}_preprocessed.csv"), fmt)
         if os.path.exists(in_path):
-            preprocess_population_monthly(in_path, out_path, year)
+            run_cached(f"PopulationMonthly_{year}{suffix}", in_path, out_path,
+                       {"fields": monthly_fields, "year": year},
+                       preprocess_population_monthly, year)
         else:
             print(f"⚠️ 월간 파일 누락: {in_path}")
 
     # 2) 연간 데이터 전처리
-    annual_fname = "202212_202412_주민등록인구기타현황(인구증감)_연간.csv"
     in_annual = os.path.join(base_dir, annual_fname)
-    out_annual = os.path.join(base_dir, "PopulationYearly_preprocessed.csv")
+    out_annual = NormIO.output_path(os.path.join(base_dir, "PopulationYearly_preprocessed.csv"), fmt)
     if os.path.exists(in_annual):
-        preprocess_population_yearly(in_annual, out_annual)
+        run_cached(f"PopulationYearly{suffix}", in_annual, out_annual,
+                   {"fields": yearly_fields},
+                   preprocess_population_yearly)
     else:
         print(f"⚠️ 연간 파일 누락: {in_annual}")
 
-    # 3) Agency 테이블용 CSV 생성
-    agency_df = pd.DataFrame(sorted(agency_records), columns=["agency_code", "name"])
-    agency_out = os.path.join(base_dir, "Agency_preprocessed.csv")
-    agency_df.to_csv(agency_out, index=False, encoding='utf-8-sig')
-    print(f"✅ Agency_preprocessed.csv 생성 완료 ({len(agency_df)}건)\n")
-
-
-
+    # 3) Agency 테이블용 CSV 생성 (목록이 바뀐 경우에만)
+    agency_out = NormIO.output_path(os.path.join(base_dir, "Agency_preprocessed.csv"), fmt)
+    agency_config = sorted(agency_records)
+    if force or not manifest.is_fresh(f"Agency{suffix}", [], [agency_out], agency_config, __file__):
+        write_agency_csv(agency_records, agency_out, fmt)
+        manifest.record(f"Agency{suffix}", [], [agency_out], agency_config, __file__)
+        manifest.save()
+    else:
+        print(f"⏭️ {os.path.basename(agency_out)} 변경 없음, 건너뜀")
@@ -1,5 +1,9 @@
 import pandas as pd
 import os
+import sys
+
+from NormCache import Manifest
+from NormIO import output_path, write_parquet
 
 # ----------------------------------------
 # 7종 SOC 파일용 전처리 스크립트
@@ -107,34 +111,82 @@ base_cols = {
     "경도": "lng"
 }
 
-# 작업 디렉토리
-base_dir = r"C:\ajouDatabaseProject\Data"
-os.makedirs(base_dir, exist_ok=True)
-
-# 저장용 리스트
-base_records = []
-detail_records = {name: [] for name in soc_files}
-
-# 2) 파일별 반복
-for name, cfg in soc_files.items():
-    df = pd.read_csv(os.path.join(base_dir, cfg['file']), encoding='utf-8-sig')
-    df = clean_columns(df)
-
-    # 공통 정보
-    tmp_base = df[list(base_cols.keys())].rename(columns=base_cols)
-    base_records.append(tmp_base)
-
-    # 상세 정보
-    det = df[list(cfg['detail_cols'].keys())].rename(columns=cfg['detail_cols'])
-    detail_records[name].append(det)
-
-# 3) FacilityBase 저장
-all_base = pd.concat(base_records, ignore_index=True).drop_duplicates(subset=['facility_id'])
-all_base.to_csv(os.path.join(base_dir, 'FacilityBase.csv'), index=False, encoding='utf-8-sig')
-print(f"✅ FacilityBase.csv ({len(all_base)}건) 저장 완료")
-
-# 4) 7개 상세 저장
-for name, dfs in detail_records.items():
-    combined = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=[list(soc_files[name]['detail_cols'].values())[0]])
-    combined.to_csv(os.path.join(base_dir, f"{name}Detail.csv"), index=False, encoding='utf-8-sig')
-    print(f"✅ {name}Detail.csv ({len(combined)}건) 저장 완료")
+# Parquet 출력 시 FacilityBase 컬럼 타입 (상세 7개는 pandas 타입 추론)
+facility_base_dtypes = {
+    "facility_id": "string",
+    "sido": "category",
+    "sigungu": "category",
+    "dong": "category",
+    "soc_type": "category",
+    "facility_type": "category",
+    "facility_name": "string",
+    "road_addr": "string",
+    "bunji_addr": "string",
+    "lat": "float64",
+    "lng": "float64"
+}
+
+def soc_outputs(base_dir: str, fmt: str = 'csv') -> list:
+    return [output_path(os.path.join(base_dir, 'FacilityBase.csv'), fmt)] + \
+           [output_path(os.path.join(base_dir, f"{name}Detail.csv"), fmt) for name in soc_files]
+
+def save_output(df: pd.DataFrame, csv_path: str, fmt: str, dtypes: dict = None) -> str:
+    path = output_path(csv_path, fmt)
+    if fmt == 'parquet':
+        write_parquet(df, path, dtypes)
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+def preprocess_soc(base_dir: str, fmt: str = 'csv'):
+    # 저장용 리스트
+    base_records = []
+    detail_records = {name: [] for name in soc_files}
+
+    # 2) 파일별 반복
+    for name, cfg in soc_files.items():
+        df = pd.read_csv(os.path.join(base_dir, cfg['file']), encoding='utf-8-sig')
+        df = clean_columns(df)
+
+        # 공통 정보
+        tmp_base = df[list(base_cols.keys())].rename(columns=base_cols)
+        base_records.append(tmp_base)
+
+        # 상세 정보
+        det = df[list(cfg['detail_cols'].keys())].rename(columns=cfg['detail_cols'])
+        detail_records[name].append(det)
+
+    # 3) FacilityBase 저장
+    all_base = pd.concat(base_records, ignore_index=True).drop_duplicates(subset=['facility_id'])
+    path = save_output(all_base, os.path.join(base_dir, 'FacilityBase.csv'), fmt, facility_base_dtypes)
+    print(f"✅ {os.path.basename(path)} ({len(all_base)}건) 저장 완료")
+
+    # 4) 7개 상세 저장
+    for name, dfs in detail_records.items():
+        combined = pd.concat(dfs, ignore_index=True).drop_duplicates(subset=[list(soc_files[name]['detail_cols'].values())[0]])
+        path = save_output(combined, os.path.join(base_dir, f"{name}Detail.csv"), fmt)
+        print(f"✅ {os.path.basename(path)} ({len(combined)}건) 저장 완료")
+
+    return len(all_base)
+
+
+if __name__ == "__main__":
+    # 작업 디렉토리
+    base_dir = r"C:\ajouDatabaseProject\Data"
+    os.makedirs(base_dir, exist_ok=True)
+
+    # 입력 7개 파일 / 설정(soc_files, base_cols) / 코드가 그대로면 건너뜀
+    fmt = 'parquet' if '--parquet' in sys.argv else 'csv'
+    key = "Soc" + ("" if fmt == 'csv' else f".{fmt}")
+    manifest = Manifest(base_dir)
+    inputs = [os.path.join(base_dir, cfg['file']) for cfg in soc_files.values()]
+    outputs = soc_outputs(base_dir, fmt)
+    config = {"soc_files": soc_files, "base_cols": base_cols}
+    if fmt == 'parquet':
+        config["dtypes"] = facility_base_dtypes
+    if '--force' not in sys.argv and manifest.is_fresh(key, inputs, outputs, config, __file__):
+        print("⏭️ SOC 전처리 결과 변경 없음, 건너뜀")
+    else:
+        preprocess_soc(base_dir, fmt)
+        manifest.record(key, inputs, outputs, config, __file__)
+        manifest.save()
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+# ========================================
+# accessibility.py
+#  Infrastructure 좌표 KD-tree + 거래별 접근성 지표 (반경 내 유형별 시설 수)
+# ========================================
+
+    # - 위경도를 지구 반지름 기준 3차원 좌표로 바꿔 cKDTree 구성 (직선거리 ≈ 지표면 거리, 수 km 이내 오차 무시 가능)
+    # - 유형(school / hospital / park / other)별로 트리 하나씩
+    # - 거래 좌표는 중복 제거 후 한 번에 질의 → N·M 쌍을 만들지 않음
+    #   (반경 내 개수: query_ball_point(return_length=True))
+    # - scipy 필요 (insert_Score.py --accessibility 사용 시에만 import)
+
+EARTH_RADIUS_M = 6_371_000.0
+FACILITY_TYPES = ['school', 'hospital', 'park', 'other']
+
+# 유형별 시설 수 → 원점수 가중치 (거래별 접근성 / insert_Score 시군구 인프라 점수 공용)
+ACCESS_WEIGHTS = {'school': 0.5, 'hospital': 0.3, 'park': 0.1, 'other': 0.1}
+
+
+# 시설 유형 분류: 점수 계산(insert_Score) / 지도(map_layers) / 격자(infra_grid) 공용
+# INFRA_TYPE_SQL은 같은 규칙의 SQL 버전 (pushdown 집계용) → 둘 중 하나를 바꾸면 다른 쪽도 같이 수정
+def classify_infra(t):
+    if '학교' in t: return 'school'
+    if '병원' in t: return 'hospital'
+    if '공원' in t: return 'park'
+    return 'other'
+
+
+INFRA_TYPE_SQL = """
+    CASE WHEN infra_type LIKE '%%학교%%' THEN 'school'
+         WHEN infra_type LIKE '%%병원%%' THEN 'hospital'
+         WHEN infra_type LIKE '%%공원%%' THEN 'park'
+         ELSE 'other' END
+"""
+
+
+def to_xyz(lat, lng) -> np.ndarray:
+    lat = np.radians(np.asarray(lat, dtype=float))
+    lng = np.radians(np.asarray(lng, dtype=float))
+    cos_lat = np.cos(lat)
+    return EARTH_RADIUS_M * np.column_stack([cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)])
+
+
+def chord(distance_m: float) -> float:
+    # 지표면 거리 → 3차원 직선거리
+    return 2 * EARTH_RADIUS_M * np.sin(distance_m / (2 * EARTH_RADIUS_M))
+
+
+class FacilityIndex:
+    """유형별 시설 좌표 KD-tree"""
+    def __init__(self, infra_df: pd.DataFrame):
+        from scipy.spatial import cKDTree
+
+        df = infra_df.dropna(subset=['latitude', 'longitude'])
+        types = df['infra_type'].map(classify_infra)
+        self.trees = {}
+        for t in FACILITY_TYPES:
+            part = df[types == t]
+            if len(part):
+                self.trees[t] = cKDTree(to_xyz(part['latitude'].astype(float), part['longitude'].astype(float)))
+
+    def features(self, lat, lng, radius_m: float = 1000) -> pd.DataFrame:
+        """
+        좌표 배열 → 지표 DataFrame (입력 순서 유지)
+        - count_{유형}: 반경 radius_m 안 시설 수
+        """
+        xyz = to_xyz(lat, lng)
+        out = pd.DataFrame(index=range(len(xyz)))
+        r = chord(radius_m)
+        for t in FACILITY_TYPES:
+            tree = self.trees.get(t)
+            out[f'count_{t}'] = tree.query_ball_point(xyz, r, return_length=True, workers=-1) if tree else 0
+        return out
+
+
+def transaction_features(index: FacilityIndex, coords: pd.DataFrame, radius_m: float = 1000) -> pd.DataFrame:
+    """
+    coords: AptTransaction_id, latitude, longitude (좌표 없는 행은 제외됨)
+    같은 좌표(같은 단지)는 한 번만 질의해서 결과를 펼침
+    """
+    coords = coords.dropna(subset=['latitude', 'longitude'])
+    unique = coords[['latitude', 'longitude']].drop_duplicates().reset_index(drop=True)
+    feats = pd.concat([unique, index.features(unique['latitude'], unique['longitude'], radius_m)], axis=1)
+    merged = coords.merge(feats, on=['latitude', 'longitude'], how='left')
+
+    merged['access_raw'] = sum(merged[f'count_{t}'] * w for t, w in ACCESS_WEIGHTS.items())
+    return merged
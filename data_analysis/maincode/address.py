@@ -0,0 +1,154 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ========================================
+# address.py
+#  주소 문자열 정규화 / 시군구·읍면동 추출 (적재 스크립트, 점수 계산, main.py 공용)
+# ========================================
+
+    # - 실제 데이터는 행 수보다 고유 주소 수가 훨씬 적음 → 고유값만 처리 후 펼침
+    #   (Series: pd.factorize로 고유값 추출 → .str.extract 한 번 → 코드 배열로 되돌림)
+    # - 한 건씩 호출하는 경우(main.py 입력값 등)는 lru_cache로 같은 문자열 재계산 방지
+    # - 문자열이 아닌 값(NaN, float 등)은 None
+
+SIGUNGU_RE = r'^(.*?[시군구])'                                  # 앞에서부터 첫 시/군/구까지 ('경기도 수원시')
+DONG_RES = [r'([가-힣]+[면읍동])', r'([가-힣]+리)']              # 면/읍/동 우선, 없으면 리
+REGION_RE = r'^([가-힣]+[도특별자치시]+ [가-힣]+[시군구])'         # 시/도 + 시군구 첫 단위
+CITY_RE = re.compile(r'^[가-힣]+[시군]$')
+PROVINCE_RE = re.compile(r'^[가-힣]+(도|특별시|광역시|특별자치시)$')    # 맨 앞 시/도 단위 ('서울특별시'는 시군이 아님)
+
+MEMO_SIZE = 1 << 16
+
+
+# --------------------
+# Series 단위 (고유값만 처리)
+# --------------------
+
+def on_unique(values, fn) -> pd.Series:
+    """values의 고유 문자열에만 fn(Series → Series)을 적용하고 원래 행 순서로 펼침"""
+    values = pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
+    result = fn(uniques.where(uniques.map(lambda v: isinstance(v, str)))).astype(object)
+    # 마지막에 None을 붙여 결측 코드(-1)가 None을 가리키게 함
+    result = np.append(result.where(result.notna(), None).to_numpy(), None)
+    return pd.Series(result[codes], index=values.index, dtype=object)
+
+
+def _normalize(s: pd.Series) -> pd.Series:
+    return s.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _sigungu(s: pd.Series) -> pd.Series:
+    return s.str.extract(SIGUNGU_RE, expand=False)
+
+
+def _dong(s: pd.Series) -> pd.Series:
+    out = s.str.extract(DONG_RES[0], expand=False)
+    for pattern in DONG_RES[1:]:
+        out = out.fillna(s.str.extract(pattern, expand=False))
+    return out
+
+
+def _region(s: pd.Series) -> pd.Series:
+    s = _normalize(s)
+    return s.str.extract(REGION_RE, expand=False).fillna(s)
+
+
+def _city_token(toks):
+    # 맨 앞 시/도를 건너뛰고 첫 시/군, 없으면 시/도 다음 단위 ('서울특별시 강남구' → '강남구')
+    rest = toks[1:] if len(toks) > 1 and PROVINCE_RE.match(toks[0]) else toks
+    return next((t for t in rest if CITY_RE.match(t)), rest[0])
+
+
+def _short_city(s: pd.Series) -> pd.Series:
+    tokens = _normalize(s).str.split(' ')
+    return tokens.map(lambda toks: _city_token(toks) if isinstance(toks, list) else None)
+
+
+def extract_sigungus(values) -> pd.Series:
+    return on_unique(values, _sigungu)
+
+
+def extract_dongs(values) -> pd.Series:
+    return on_unique(values, _dong)
+
+
+def region_names(values) -> pd.Series:
+    return on_unique(values, _region)
+
+
+def short_cities(values) -> pd.Series:
+    return on_unique(values, _short_city)
+
+
+# --------------------
+# 한 건 단위 (메모이즈)
+# --------------------
+
+def _scalar(fn):
+    @lru_cache(maxsize=MEMO_SIZE)
+    def memo(value):
+        return fn(pd.Series([value], dtype=object)).iloc[0]
+
+    def wrapper(value):
+        if not isinstance(value, str):
+            return None
+        result = memo(value)
+        return None if pd.isna(result) else result
+
+    wrapper.cache_info = memo.cache_info
+    return wrapper
+
+
+extract_sigungu = _scalar(_sigungu)        # '경기도 수원시 팔달구 인계동' → '경기도 수원시'
+extract_dong = _scalar(_dong)              # '... 인계동 1111' → '인계동'
+region_name = _scalar(_region)             # '경기도 수원시 장안구 정자동' → '경기도 수원시'
+short_city = _scalar(_short_city)          # '경기도 수원시' → '수원시'
+
+
+if __name__ == '__main__':
+    import argparse
+    import random
+    import time
+
+    # 백만 행 주소 컬럼: 행 단위 .apply(re) vs 고유값 벡터화
+    parser = argparse.ArgumentParser(description="주소 추출 벤치마크")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--distinct', type=int, default=5_000)
+    args = parser.parse_args()
+
+    cities = ['수원시 장안구', '수원시 팔달구', '성남시 분당구', '용인시 수지구', '화성시', '가평군', '부천시']
+    dongs = ['정자동', '인계동', '삼평동', '풍덕천동', '봉담읍', '청평면', '상동']
+    pool = [f"경기도 {random.choice(cities)} {random.choice(dongs)} {random.randint(1, 999)}-{random.randint(0, 30)}"
+            for _ in range(args.distinct)]
+    column = pd.Series(random.choices(pool, k=args.rows) + [None])
+
+    def apply_sigungu(v):
+        if not isinstance(v, str):
+            return None
+        m = re.match(SIGUNGU_RE, v)
+        return m.group(1) if m else None
+
+    def apply_dong(v):
+        if not isinstance(v, str):
+            return None
+        for p in DONG_RES:
+            m = re.search(p, v)
+            if m:
+                return m.group(1)
+        return None
+
+    for label, row_fn, vec_fn in (('sigungu', apply_sigungu, extract_sigungus), ('dong', apply_dong, extract_dongs)):
+        start = time.perf_counter()
+        expected = column.apply(row_fn)
+        t_apply = time.perf_counter() - start
+        start = time.perf_counter()
+        got = vec_fn(column)
+        t_vec = time.perf_counter() - start
+        same = expected.fillna('').equals(got.fillna(''))
+        print(f"{label:<8} apply {t_apply:6.2f}s  unique {t_vec:6.2f}s  x{t_apply / t_vec:5.1f}  "
+              f"{'✅ 결과 일치' if same else '❌ 결과 불일치'}")
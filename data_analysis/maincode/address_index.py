@@ -0,0 +1,205 @@
+import os
+import pickle
+import re
+from collections import defaultdict
+
+import pandas as pd
+
+from database.files import preprocessed_path, read_preprocessed
+from geocache import normalize_address
+
+# ========================================
+# address_index.py
+#  보유 데이터(병원 / 기타 시설 / 학교)의 주소·좌표로 만든 오프라인 주소 → 좌표 인덱스
+# ========================================
+
+    # - 키: (시/군, 도로명, 건물본번, 건물부번)  예) ('수원시', '효원로', 241, 0)
+    # - 조회 순서: 건물번호 일치 → 본번 일치 → 도로(길) 중심 → 읍면동 중심 → 없음(None)
+    # - 중심 좌표는 같은 키에 속한 시설 좌표의 평균
+    # - 인덱스는 pickle로 저장, 원본 파일이 더 최신이면 다시 생성
+
+INDEX_NAME = 'address_index.pkl'
+
+# 경기도 좌표 범위 (0, 결측, 다른 지역 좌표 제외)
+LAT_RANGE = (36.8, 38.4)
+LNG_RANGE = (126.3, 127.9)
+
+ROAD_RE = re.compile(r'([가-힣A-Za-z0-9·]+?(?:로|길))\s*(\d+)(?:-(\d+))?(?![\d가-힣])')
+CITY_RE = re.compile(r'^[가-힣]+[시군]$')
+DONG_RE = re.compile(r'^[가-힣0-9]+(?:동|읍|면|리|가)$')
+
+LEVELS = ('exact', 'building', 'street', 'dong')
+
+
+def split_city(address: str):
+    """'경기도 수원시 팔달구 ...' → ('수원시', 나머지 토큰 목록)"""
+    tokens = normalize_address(address).split(' ')
+    for i, tok in enumerate(tokens):
+        if CITY_RE.match(tok):
+            return tok, tokens[i + 1:]
+    return None, tokens
+
+
+def parse_road(address):
+    """도로명주소 → (시/군, 도로명, 본번, 부번) 또는 None"""
+    city, rest = split_city(address)
+    if not city:
+        return None
+    # 괄호 안 참고항목('(인계동)') 제거 후 마지막 '도로명 + 건물번호'
+    text = re.sub(r'\(.*?\)', ' ', ' '.join(rest))
+    matches = ROAD_RE.findall(text)
+    if not matches:
+        return None
+    road, main, sub = matches[-1]
+    return city, road, int(main), int(sub or 0)
+
+
+def parse_dongs(address):
+    """지번주소 / 시군구 문자열 → (시/군, [읍면동 후보...]) (가까운 단위가 앞)"""
+    city, rest = split_city(address)
+    return city, [tok for tok in reversed(rest) if DONG_RE.match(tok)]
+
+
+class AddressIndex:
+    def __init__(self):
+        self.tables = {level: {} for level in LEVELS}
+
+    @classmethod
+    def build(cls, points: pd.DataFrame):
+        """points: road_address, jibun_address, lat, lng 컬럼 (주소 하나는 없어도 됨)"""
+        ok = points['lat'].between(*LAT_RANGE) & points['lng'].between(*LNG_RANGE)
+        points = points[ok]
+
+        sums = {level: defaultdict(lambda: [0.0, 0.0, 0]) for level in LEVELS}
+
+        def add(level, key, lat, lng):
+            acc = sums[level][key]
+            acc[0] += lat
+            acc[1] += lng
+            acc[2] += 1
+
+        for road_addr, jibun_addr, lat, lng in points[['road_address', 'jibun_address', 'lat', 'lng']].itertuples(index=False):
+            parsed = parse_road(road_addr)
+            if parsed:
+                city, road, main, sub = parsed
+                add('exact', (city, road, main, sub), lat, lng)
+                add('building', (city, road, main), lat, lng)
+                add('street', (city, road), lat, lng)
+            for addr in (jibun_addr, road_addr):
+                city, dongs = parse_dongs(addr)
+                if city and dongs:
+                    add('dong', (city, dongs[0]), lat, lng)
+                    break
+
+        index = cls()
+        for level in LEVELS:
+            index.tables[level] = {k: (la / n, ln / n) for k, (la, ln, n) in sums[level].items()}
+        return index
+
+    def lookup(self, address, region: str = None):
+        """
+        (lat, lng, level) 반환, 못 찾으면 (None, None, None)
+        - address: '경기도 수원시 효원로 241' 형태 (시군구 + 도로명)
+        - region: 읍면동 중심 대체용 시군구 문자열 (예: '경기도 수원시 팔달구 인계동')
+        """
+        parsed = parse_road(address)
+        if parsed:
+            city, road, main, sub = parsed
+            for level, key in (('exact', (city, road, main, sub)), ('building', (city, road, main)),
+                               ('street', (city, road))):
+                hit = self.tables[level].get(key)
+                if hit:
+                    return hit[0], hit[1], level
+
+        city, dongs = parse_dongs(region or address)
+        for dong in dongs:
+            hit = self.tables['dong'].get((city, dong))
+            if hit:
+                return hit[0], hit[1], 'dong'
+        return None, None, None
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            pickle.dump(self.tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str):
+        index = cls()
+        with open(path, 'rb') as f:
+            index.tables = pickle.load(f)
+        return index
+
+    def summary(self) -> str:
+        return ', '.join(f"{level} {len(self.tables[level]):,}" for level in LEVELS)
+
+
+# --------------------
+# 원본 데이터 → 좌표 목록
+# --------------------
+
+def source_paths(base_dir: str, fmt: str = 'csv') -> dict:
+    return {
+        'hospital': preprocessed_path(base_dir, 'Hospital', fmt),
+        'facility': preprocessed_path(base_dir, 'FacilityBase', fmt),
+        'school': os.path.join(base_dir, 'school.csv'),
+    }
+
+
+def load_points(base_dir: str, fmt: str = 'csv') -> pd.DataFrame:
+    paths = source_paths(base_dir, fmt)
+    frames = []
+
+    if os.path.exists(paths['hospital']):
+        df = read_preprocessed(paths['hospital'])
+        frames.append(df[['road_address', 'jibun_address', 'lat', 'lng']])
+
+    if os.path.exists(paths['facility']):
+        df = read_preprocessed(paths['facility'])
+        frames.append(df.rename(columns={'road_addr': 'road_address', 'bunji_addr': 'jibun_address'})
+                        [['road_address', 'jibun_address', 'lat', 'lng']])
+
+    if os.path.exists(paths['school']):
+        df = pd.read_csv(paths['school'], encoding='cp949')
+        frames.append(df.rename(columns={'소재지도로명주소': 'road_address', '소재지지번주소': 'jibun_address',
+                                         'WGS84위도': 'lat', 'WGS84경도': 'lng'})
+                        [['road_address', 'jibun_address', 'lat', 'lng']])
+
+    points = pd.concat(frames, ignore_index=True)
+    points['lat'] = pd.to_numeric(points['lat'], errors='coerce')
+    points['lng'] = pd.to_numeric(points['lng'], errors='coerce')
+    return points
+
+
+def load_or_build(base_dir: str, fmt: str = 'csv', index_path: str = None) -> AddressIndex:
+    """저장된 인덱스가 원본 파일보다 최신이면 로드, 아니면 새로 생성 후 저장"""
+    index_path = index_path or os.path.join(base_dir, INDEX_NAME)
+    sources = [p for p in source_paths(base_dir, fmt).values() if os.path.exists(p)]
+    if os.path.exists(index_path) and all(os.path.getmtime(p) <= os.path.getmtime(index_path) for p in sources):
+        return AddressIndex.load(index_path)
+
+    index = AddressIndex.build(load_points(base_dir, fmt))
+    index.save(index_path)
+    print(f"🗺️ 주소 인덱스 생성: {index.summary()} → {index_path}")
+    return index
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="오프라인 주소 인덱스 생성")
+    parser.add_argument('--base-dir', default='C:/Users/김성진/OneDrive/Desktop/Apartment-transaction-analysis/file_list')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    args = parser.parse_args()
+
+    index_path = os.path.join(args.base_dir, INDEX_NAME)
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    index = load_or_build(args.base_dir, args.format)
+
+    # 조회 속도 확인
+    sample = ['경기도 수원시 효원로 241'] * 100_000
+    start = time.perf_counter()
+    for addr in sample:
+        index.lookup(addr)
+    print(f"⏱️ 조회 1건당 {(time.perf_counter() - start) / len(sample) * 1e6:.1f}µs")
@@ -0,0 +1,147 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from address import short_cities
+from main import (
+    create_interactive_map, create_top10_table_html, locate_addresses, query_top10, read_query,
+)
+from scoring import PROFILES, profile_column
+
+# ========================================
+# batch_recommend.py
+#  여러 시(또는 경기도 전체) × 목적별 Top10 표/지도 일괄 생성 (input() 없이)
+# ========================================
+
+    # - DB 연결 풀 / 지오코드 캐시 / 주소 인덱스는 main.py 모듈 것을 그대로 한 번만 사용
+    # - 조회는 도시 수와 무관하게 묶어서: ScoreTopN 1회, Infrastructure 1회, BusUsage 월별 합계 1회
+    #   (ScoreTopN에 없는 도시만 main.query_top10으로 개별 조회)
+    # - 좌표는 전체 Top10 주소를 한 번에 조회 (오프라인 인덱스 → 미스만 지오코더)
+    # - HTML 렌더링(folium 지도 / 표)은 작업 프로세스에서 병렬로, 도시별 준비 + 렌더링 시간 출력
+
+
+def load_cities():
+    # 경기도 전체: Region 표준명 (Score / ScoreTopN의 sigungu와 같은 값)
+    return read_query("SELECT name FROM Region ORDER BY region_id")['name'].tolist()
+
+
+def load_top10_all(purposes):
+    query = f"""
+        SELECT sigungu, purpose, apt_name, area, price, build_year, road_name, apt_sigungu,
+               score, txn_year AS year
+        FROM ScoreTopN
+        WHERE year = 0 AND purpose IN ({', '.join('?' * len(purposes))})
+        ORDER BY sigungu, purpose, rank_no
+    """
+    return read_query(query, [int(p) for p in purposes])
+
+
+def load_infrastructure_all():
+    return read_query("""
+        SELECT sigungu, facility_name, infra_type, latitude, longitude
+        FROM Infrastructure
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    """)
+
+
+def load_bus_monthly():
+    # main.get_avg_bus_passengers와 같은 계산: 시 이름이 들어간 시군구의 월별 합계 → 월 평균
+    df = read_query("""
+        SELECT sigungu, year, month, SUM(passengers) AS total_passengers
+        FROM BusUsage
+        GROUP BY sigungu, year, month
+    """)
+    df['total_passengers'] = df['total_passengers'].astype(float)
+    return df
+
+
+def avg_bus_passengers(bus_df, city_short, year):
+    rows = bus_df[bus_df['sigungu'].str.contains(city_short, regex=False) & (bus_df['year'] == int(year))]
+    if rows.empty:
+        return None
+    return round(rows.groupby(['year', 'month'])['total_passengers'].sum().mean(), 2)
+
+
+def collect_top10(cities, purposes):
+    # ScoreTopN 일괄 조회, 비어 있는 (도시, 목적)만 Score 정렬로 대체
+    top = load_top10_all(purposes)
+    top = top[top['sigungu'].isin(cities)]
+    frames = []
+    for city in cities:
+        for purpose in purposes:
+            df = top[(top['sigungu'] == city) & (top['purpose'] == purpose)].drop(columns='purpose')
+            df = df.rename(columns={'score': profile_column(purpose)})
+            if df.empty:
+                df = query_top10(city, purpose)
+            frames.append(df.assign(city=city, purpose=purpose))
+    return pd.concat(frames, ignore_index=True)
+
+
+def render(city, purpose, df, infra_df):
+    # 작업 프로세스: 지도 + 표 HTML 저장, (경로, 렌더링 시간) 반환
+    start = time.perf_counter()
+    tag = f"{city.replace(' ', '_')}_{PROFILES[purpose]['name']}"
+    map_file = create_interactive_map(df, infra_df, city, tag)
+    table_file = create_top10_table_html(df, tag)
+    return map_file, table_file, time.perf_counter() - start
+
+
+def run_batch(cities, purposes, workers):
+    start = time.perf_counter()
+    top = collect_top10(cities, purposes)
+    infra = load_infrastructure_all()
+    bus = load_bus_monthly()
+
+    # 전체 Top10 주소 좌표를 한 번에 조회
+    top['full_address'] = top['sigungu'] + ' ' + top['road_name']
+    coords = locate_addresses(top['full_address'].tolist(), top['apt_sigungu'].tolist())
+    top['latitude'] = [lat for lat, _ in coords]
+    top['longitude'] = [lng for _, lng in coords]
+    shared = time.perf_counter() - start
+    print(f"📥 공통 조회/좌표: {shared:.2f}s (도시 {len(cities)}개 × 목적 {len(purposes)}개, 거래 {len(top)}건)")
+
+    shorts = dict(zip(cities, short_cities(cities)))
+    jobs, prep = [], {}
+    for (city, purpose), df in top.groupby(['city', 'purpose'], sort=False):
+        t0 = time.perf_counter()
+        # 다른 목적의 점수 컬럼 제거 (표는 '_score' 컬럼 하나만 사용)
+        others = [profile_column(p) for p in purposes if p != purpose]
+        df = df.drop(columns=['city', 'purpose', *others], errors='ignore').reset_index(drop=True)
+        if df['latitude'].isna().all():
+            print(f"⚠️ {city} / {PROFILES[purpose]['label']}: 추천 결과 또는 좌표 없음, 건너뜀")
+            continue
+        year = df['year'].iloc[0]
+        df['passengers'] = avg_bus_passengers(bus, shorts[city] or city, year)
+        jobs.append((city, purpose, df, infra[infra['sigungu'] == city]))
+        prep[city] = prep.get(city, 0) + time.perf_counter() - t0
+
+    # 공통 조회 시간은 도시 수로 나눠 도시별 시간에 포함
+    per_city = {city: shared / len(cities) + t for city, t in prep.items()}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(job[0], job[1], pool.submit(render, *job)) for job in jobs]
+        for city, purpose, future in futures:
+            map_file, table_file, seconds = future.result()
+            per_city[city] += seconds
+            print(f"🗺️ {city} / {PROFILES[purpose]['label']}: {os.path.basename(map_file)}, "
+                  f"{os.path.basename(table_file)} ({seconds:.2f}s)")
+
+    print("\n⏱️ 도시별 소요 시간 (공통 조회 분배 + 준비 + 렌더링)")
+    for city, seconds in per_city.items():
+        print(f"  {city:<20} {seconds:6.2f}s")
+    total = time.perf_counter() - start
+    print(f"🎉 전체 {total:.2f}s, 도시당 평균 {total / max(len(cities), 1):.2f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="도시별 Top10 추천 일괄 생성")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--cities', nargs='+', help='예: "경기도 수원시" "경기도 성남시"')
+    target.add_argument('--all', action='store_true', help='경기도 전체 (Region 테이블 기준)')
+    parser.add_argument('--purposes', type=int, nargs='+', default=[1, 2], choices=list(PROFILES))
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    run_batch(load_cities() if args.all else args.cities, args.purposes, args.workers)
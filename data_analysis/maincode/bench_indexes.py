@@ -0,0 +1,122 @@
+import argparse
+import statistics
+import time
+
+from database.db import Query
+from database.handler import partition_name
+
+# ========================================
+# bench_indexes.py
+#  주요 조회의 EXPLAIN + 인덱스 사용/미사용 지연 시간, 연도 재적재(DELETE vs TRUNCATE PARTITION) 비교
+# ========================================
+
+    # - 조회 목록은 main.py / insert_Score.py에서 실제로 실행하는 쿼리 그대로
+    # - 인덱스 미사용 측정은 같은 쿼리에 IGNORE INDEX 힌트를 붙여 실행
+    # - 재적재 비교는 AptTransaction을 bench_AptTransaction(같은 파티션 구조)으로 복사해서 측정
+
+HOT_QUERIES = [
+    ("Score Top10 (실거주)", """
+        SELECT s.sigungu, a.apt_name, a.area, a.price, a.build_year, a.road_name, s.residence_score, s.year
+        FROM Score s {hint}
+        JOIN AptTransaction a ON s.AptTransaction_id = a.id AND a.year = s.year
+        WHERE s.sigungu = %s
+        ORDER BY s.residence_score DESC
+        LIMIT 10
+    """, "IGNORE INDEX (idx_sigungu_residence, idx_sigungu_investment)", ["city"]),
+    ("Score Top10 (투자)", """
+        SELECT s.sigungu, a.apt_name, a.area, a.price, a.build_year, a.road_name, s.investment_score, s.year
+        FROM Score s {hint}
+        JOIN AptTransaction a ON s.AptTransaction_id = a.id AND a.year = s.year
+        WHERE s.sigungu = %s
+        ORDER BY s.investment_score DESC
+        LIMIT 10
+    """, "IGNORE INDEX (idx_sigungu_residence, idx_sigungu_investment)", ["city"]),
+    ("Infrastructure 시군구", """
+        SELECT facility_name, infra_type, latitude, longitude
+        FROM Infrastructure {hint}
+        WHERE sigungu = %s AND latitude IS NOT NULL AND longitude IS NOT NULL
+    """, "IGNORE INDEX (idx_sigungu_type)", ["city"]),
+    ("BusUsage 시군구+연도", """
+        SELECT year, month, SUM(passengers) as total_passengers
+        FROM BusUsage {hint}
+        WHERE sigungu LIKE %s AND year = %s
+        GROUP BY year, month
+    """, "IGNORE INDEX (idx_sigungu_year_month)", ["like_city", "year"]),
+    ("BusUsage 점수 집계", """
+        SELECT sigungu, year, SUM(passengers) as total_passengers FROM BusUsage {hint} GROUP BY sigungu, year
+    """, "IGNORE INDEX (idx_sigungu_year_month)", []),
+    ("PopulationStats 점수 집계", """
+        SELECT sigungu, year, total_population FROM PopulationStats {hint}
+    """, "IGNORE INDEX (idx_sigungu_year)", []),
+    ("Score 기존 거래 id", """
+        SELECT AptTransaction_id FROM Score {hint}
+    """, "IGNORE INDEX (idx_txn)", []),
+]
+
+
+def time_query(db, sql, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db.execute(sql, params)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def explain(db, sql, params):
+    rows = db.execute("EXPLAIN " + sql, params)
+    columns = [d[0] for d in db.description]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def bench_queries(db, city, year, repeat):
+    values = {"city": city, "like_city": f"%{city.split()[-1]}%", "year": year}
+    print(f"=== 조회 ({city}, {year}) 중앙값 {repeat}회 ===")
+    for label, template, hint, names in HOT_QUERIES:
+        params = [values[n] for n in names] or None
+        indexed = template.replace("{hint}", "")
+        for plan in explain(db, indexed, params):
+            print(f"  EXPLAIN {plan['table']:<16} type={plan['type']:<7} key={plan['key']} "
+                  f"rows={plan['rows']} partitions={plan.get('partitions')}")
+        with_index = time_query(db, indexed, params, repeat)
+        without = time_query(db, template.replace("{hint}", hint), params, repeat)
+        print(f"{label:<24} 인덱스 {with_index:9.2f}ms  미사용 {without:9.2f}ms  x{without / with_index:6.1f}")
+
+
+def bench_reload(db, year):
+    print(f"\n=== {year}년 재적재: DELETE vs TRUNCATE PARTITION ===")
+    db.execute("DROP TABLE IF EXISTS bench_AptTransaction")
+    db.execute("CREATE TABLE bench_AptTransaction LIKE AptTransaction")
+    db.execute("INSERT INTO bench_AptTransaction SELECT * FROM AptTransaction")
+    db.conn.commit()
+
+    start = time.perf_counter()
+    db.execute("DELETE FROM bench_AptTransaction WHERE year = %s", [year])
+    db.conn.commit()
+    deleted = time.perf_counter() - start
+
+    db.execute("INSERT INTO bench_AptTransaction SELECT * FROM AptTransaction WHERE year = %s", [year])
+    db.conn.commit()
+
+    start = time.perf_counter()
+    db.execute(f"ALTER TABLE bench_AptTransaction TRUNCATE PARTITION {partition_name(year)}")
+    truncated = time.perf_counter() - start
+
+    db.execute("DROP TABLE bench_AptTransaction")
+    print(f"DELETE ... WHERE year = {year}: {deleted:.2f}s")
+    print(f"TRUNCATE PARTITION {partition_name(year)}: {truncated:.2f}s  x{deleted / truncated:.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="인덱스/파티션 효과 측정")
+    parser.add_argument('--city', default='경기도 수원시')
+    parser.add_argument('--year', type=int, default=2024)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--skip-reload', action='store_true')
+    args = parser.parse_args()
+
+    db = Query()
+    with db.session():
+        bench_queries(db, args.city, args.year, args.repeat)
+        if not args.skip_reload:
+            bench_reload(db, args.year)
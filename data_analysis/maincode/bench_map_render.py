@@ -0,0 +1,62 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from map_layers import build_map
+
+# ========================================
+# bench_map_render.py
+#  지도 렌더링: 기존 행별 Marker vs 유형별 FastMarkerCluster 레이어, 렌더링 시간 / HTML 크기 비교
+# ========================================
+
+    # - --city: 해당 시 Infrastructure 실제 데이터 (main.get_infrastructure_by_city)
+    # - --synthetic N: DB 없이 수원 부근 임의 좌표 N개 (시설 유형은 학교/병원/공원/주차장 순환)
+    # - 렌더링 시간 = 지도 객체 생성 + HTML 저장
+
+SYNTHETIC_TYPES = ['초등학교', '병원', '공원', '주차장']
+
+
+def synthetic_infra(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'facility_name': [f"시설{i}" for i in range(n)],
+        'infra_type': [SYNTHETIC_TYPES[i % len(SYNTHETIC_TYPES)] for i in range(n)],
+        'latitude': 37.26 + rng.normal(0, 0.03, n),
+        'longitude': 127.03 + rng.normal(0, 0.03, n),
+    })
+
+
+def render(infra_df, fast, path):
+    start = time.perf_counter()
+    apts = pd.DataFrame(columns=['apt_name', 'area', 'price', 'latitude', 'longitude'])
+    build_map(apts, infra_df, fast=fast).save(path)
+    return time.perf_counter() - start, os.path.getsize(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="지도 렌더링 방식 비교")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--city', help='예: "경기도 수원시"')
+    source.add_argument('--synthetic', type=int, nargs='+', help='임의 시설 수 (여러 개 가능)')
+    args = parser.parse_args()
+
+    if args.city:
+        from main import get_infrastructure_by_city
+        datasets = [(args.city, get_infrastructure_by_city(args.city))]
+    else:
+        datasets = [(f"synthetic {n:,}", synthetic_infra(n)) for n in args.synthetic]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, infra in datasets:
+            print(f"📍 {name}: 시설 {len(infra):,}개")
+            results = {}
+            for mode, fast in (('marker', False), ('fast', True)):
+                seconds, size = render(infra, fast, os.path.join(tmp, f"{mode}.html"))
+                results[mode] = (seconds, size)
+                print(f"  {mode:<7} {seconds:7.2f}s  {size / 1024:9,.0f} KB")
+            (t_old, s_old), (t_new, s_new) = results['marker'], results['fast']
+            print(f"  ⏱️ 렌더링 x{t_old / t_new:.1f}, HTML {s_new / s_old:.0%} 크기")
@@ -0,0 +1,75 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from database.files import preprocessed_path
+from database.parallel import create_pool_engine, parallel_insert
+from insert_AptTransaction import load_apt_df
+from insert_Infrastructure import DB_URL, load_facility_base_df, load_hospital_df, load_school_df
+
+# ========================================
+# bench_parallel_loader.py
+#  다중 연결 청크 INSERT 속도 곡선 (연결 1~8개)
+# ========================================
+
+    # - 대상: AptTransaction 2022/2023/2024, Infrastructure(학교+병원+기타 시설 합본)
+    # - 실제 테이블 대신 bench_* 복제 테이블(CREATE TABLE ... LIKE)에 적재, 매 회 TRUNCATE
+    # - 기준값: 같은 데이터의 DataFrame.to_sql (단일 연결)
+
+
+def reset_table(engine, table: str, source: str):
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS `{table}` LIKE `{source}`"))
+        conn.execute(text(f"TRUNCATE TABLE `{table}`"))
+
+
+def bench_dataset(label: str, df: pd.DataFrame, source: str, max_workers: int, chunksize: int):
+    table = f"bench_{source}"
+    base_engine = create_engine(DB_URL, echo=False)
+
+    reset_table(base_engine, table, source)
+    start = time.perf_counter()
+    df.to_sql(table, con=base_engine, if_exists='append', index=False)
+    baseline = time.perf_counter() - start
+    print(f"\n=== {label} ({len(df):,}건) ===")
+    print(f"to_sql        {baseline:8.2f}s  {len(df) / baseline:>10,.0f} rows/s")
+
+    first = None
+    for workers in range(1, max_workers + 1):
+        reset_table(base_engine, table, source)
+        engine = create_pool_engine(DB_URL, workers)
+        start = time.perf_counter()
+        parallel_insert(engine, table, df, chunksize, workers)
+        seconds = time.perf_counter() - start
+        engine.dispose()
+
+        first = first or seconds
+        print(f"{workers} connection{'s' if workers > 1 else ' '}  {seconds:8.2f}s  "
+              f"{len(df) / seconds:>10,.0f} rows/s  x{first / seconds:4.2f} (vs 1)  x{baseline / seconds:4.2f} (vs to_sql)")
+
+    with base_engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS `{table}`"))
+    base_engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="다중 연결 청크 INSERT 벤치마크")
+    parser.add_argument('--base-dir', default='C:/Users/김성진/OneDrive/Desktop/Apartment-transaction-analysis/file_list')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument('--chunksize', type=int, default=5000)
+    args = parser.parse_args()
+
+    for year in (2022, 2023, 2024):
+        df = load_apt_df(preprocessed_path(args.base_dir, f'AptTransaction_{year}_preprocessed', args.format))
+        bench_dataset(f"AptTransaction {year}", df, 'AptTransaction', args.max_workers, args.chunksize)
+
+    infra = pd.concat([
+        load_school_df(os.path.join(args.base_dir, 'school.csv')),
+        load_hospital_df(preprocessed_path(args.base_dir, 'Hospital', args.format)),
+        load_facility_base_df(preprocessed_path(args.base_dir, 'FacilityBase', args.format)),
+    ], ignore_index=True)
+    bench_dataset("Infrastructure (학교+병원+기타)", infra, 'Infrastructure', args.max_workers, args.chunksize)
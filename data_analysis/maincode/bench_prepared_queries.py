@@ -0,0 +1,96 @@
+import argparse
+import statistics
+import time
+
+from database.db import Query
+
+# ========================================
+# bench_prepared_queries.py
+#  반복 조회 지연 시간 비교: 문자열 조립 vs 클라이언트 바인딩 vs 서버 측 prepared statement
+# ========================================
+
+    # - 조회 대상: main.py의 Top10(목적별) / 인프라 / 버스 이용객 조회
+    # - inline  : 예전 방식 (f-string으로 값까지 넣은 SQL → 매번 다른 문장, 매번 파싱)
+    # - client  : '%s' 바인딩 (MySQLdb가 클라이언트에서 값을 이스케이프해 끼움 → 서버 입장에선 inline과 같음)
+    # - prepared: '?' + PREPARE 1회 후 EXECUTE 반복 (database/db.py execute_prepared)
+    # - 모드마다 연결 하나로 시군구 목록 전체를 --repeat회 반복, 쿼리 1건당 지연 시간 집계
+
+TOP10 = """
+    SELECT s.sigungu, a.apt_name, a.area, a.price, a.build_year,
+           a.road_name, s.`{score}`, s.year
+    FROM Score s
+    JOIN AptTransaction a ON s.AptTransaction_id = a.id AND a.year = s.year
+    WHERE s.sigungu = {ph}
+    ORDER BY s.`{score}` DESC
+    LIMIT 10
+"""
+INFRA = """
+    SELECT facility_name, infra_type, latitude, longitude
+    FROM Infrastructure
+    WHERE sigungu = {ph} AND latitude IS NOT NULL AND longitude IS NOT NULL
+"""
+BUS = """
+    SELECT year, month, SUM(passengers) as total_passengers
+    FROM BusUsage
+    WHERE sigungu LIKE {ph} AND year = {ph2}
+    GROUP BY year, month
+"""
+
+
+def lookups(city: str, year: int = 2024):
+    # (SQL 템플릿, 파라미터) 목록
+    short_city = city.split()[-1]
+    return [
+        (TOP10.replace("{score}", "residence_score"), [city]),
+        (TOP10.replace("{score}", "investment_score"), [city]),
+        (INFRA, [city]),
+        (BUS, [f"%{short_city}%", year]),
+    ]
+
+
+def run_inline(db, template, params):
+    # 값을 SQL 리터럴로 직접 삽입 (conn.literal은 이스케이프된 bytes 반환)
+    literals = [db.conn.literal(p).decode() for p in params]
+    sql = template.replace("{ph}", literals[0]).replace("{ph2}", literals[-1])
+    return db.execute(sql)
+
+
+def run_client(db, template, params):
+    return db.execute(template.replace("{ph}", "%s").replace("{ph2}", "%s"), params)
+
+
+def run_prepared(db, template, params):
+    return db.execute(template.replace("{ph}", "?").replace("{ph2}", "?"), params, prepared=True)
+
+
+def bench(mode, runner, cities, repeat):
+    db = Query()
+    timings = []
+    with db.session():
+        for _ in range(repeat):
+            for city in cities:
+                for template, params in lookups(city):
+                    start = time.perf_counter()
+                    runner(db, template, params)
+                    timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{mode:<9} {len(timings):>6}건  평균 {statistics.mean(timings):7.3f}ms  "
+          f"중앙값 {statistics.median(timings):7.3f}ms  p95 {p95:7.3f}ms")
+    return statistics.mean(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="반복 조회 지연 시간 비교")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    cities = [row[0] for row in Query().query("SELECT DISTINCT sigungu FROM Score")]
+    print(f"시군구 {len(cities)}개 x 조회 4종 x {args.repeat}회")
+
+    # 첫 실행의 버퍼 풀 적재 영향을 줄이기 위해 한 번 예열
+    bench("warmup", run_client, cities, 1)
+    results = {mode: bench(mode, runner, cities, args.repeat)
+               for mode, runner in [("inline", run_inline), ("client", run_client), ("prepared", run_prepared)]}
+    print(f"📈 prepared vs inline: x{results['inline'] / results['prepared']:.2f}")
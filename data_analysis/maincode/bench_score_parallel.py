@@ -0,0 +1,59 @@
+import argparse
+import time
+
+import pandas as pd
+
+from insert_Score import (
+    SCORE_COLS, calculate_transaction_score_grouped, compute_components, engine, get_bus_score, get_infra_score,
+    get_max_transaction_id, get_population_score, get_school_score, get_transaction_base,
+    join_scores_to_transactions, map_partitions, partition_regions,
+)
+
+# ========================================
+# bench_score_parallel.py
+#  점수 계산: 직렬(run_full 경로) vs 지역 분할 병렬(--workers), DB 기록 없이 계산만 비교
+# ========================================
+
+    # - 병렬 결과는 작업 프로세스에서 DataFrame으로 돌려받아 직렬 결과와 거래별로 비교 (소수 둘째 자리)
+    # - 작업 수별 소요 시간 / 직렬 대비 배율 출력
+
+
+def serial_scores(max_id):
+    txn_raw = get_transaction_base(engine, upto_id=max_id)
+    return join_scores_to_transactions(txn_raw, calculate_transaction_score_grouped(txn_raw),
+                                       get_population_score(engine), get_bus_score(engine),
+                                       get_infra_score(engine), get_school_score(engine))
+
+
+def parallel_scores(max_id, workers):
+    stats, components = compute_components(engine, max_id)
+    frames = map_partitions(partition_regions(stats, workers), max_id, components, workers, write=False)
+    return pd.concat(frames, ignore_index=True)
+
+
+def compare(serial, parallel):
+    cmp = serial.merge(parallel, on='AptTransaction_id', how='outer', suffixes=('_s', '_p'), indicator=True)
+    bad = cmp['_merge'] != 'both'
+    for c in SCORE_COLS:
+        bad |= (cmp[f'{c}_s'] - cmp[f'{c}_p']).abs() > 0.01
+    return cmp[bad]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    max_id = get_max_transaction_id(engine)
+    start = time.perf_counter()
+    serial = serial_scores(max_id)
+    t_serial = time.perf_counter() - start
+    print(f"serial      {t_serial:8.2f}s  거래 {len(serial):,}건")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        parallel = parallel_scores(max_id, workers)
+        elapsed = time.perf_counter() - start
+        diff = compare(serial, parallel)
+        print(f"workers={workers:<3} {elapsed:8.2f}s  x{t_serial / elapsed:5.2f}  "
+              f"{'✅ 점수 일치' if diff.empty else f'❌ 불일치 {len(diff)}건'}")
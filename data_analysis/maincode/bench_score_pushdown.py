@@ -0,0 +1,58 @@
+import time
+
+import pandas as pd
+
+from insert_Score import (
+    calculate_transaction_score_grouped, compute_groups_sql, engine, get_bus_score, get_infra_score,
+    get_max_transaction_id, get_population_score, get_school_score, get_transaction_base, group_scores,
+    group_stats, GROUP_KEYS,
+)
+
+# ========================================
+# bench_score_pushdown.py
+#  점수 집계 경로 비교: pandas(원본 행 전송) vs SQL 집계(--pushdown)
+# ========================================
+
+    # - 같은 연결에서 실행 전후 SHOW SESSION STATUS 'Bytes_sent'(서버 → 클라이언트) 차이로 전송량 측정
+    # - 두 경로의 (region_id, year) 그룹 점수가 같은지 확인 (소수 둘째 자리 기준)
+
+
+def bytes_sent(conn) -> int:
+    return int(pd.read_sql("SHOW SESSION STATUS LIKE 'Bytes_sent'", conn)['Value'].iloc[0])
+
+
+def pandas_path(conn, max_id):
+    txn_raw = get_transaction_base(conn, upto_id=max_id)
+    calculate_transaction_score_grouped(txn_raw)
+    return group_scores(group_stats(txn_raw), get_population_score(conn), get_bus_score(conn),
+                        get_infra_score(conn), get_school_score(conn))
+
+
+def sql_path(conn, max_id):
+    return compute_groups_sql(conn, max_id)[1]
+
+
+def measure(label, fn, max_id):
+    with engine.connect() as conn:
+        before = bytes_sent(conn)
+        start = time.perf_counter()
+        groups = fn(conn, max_id)
+        elapsed = time.perf_counter() - start
+        sent = bytes_sent(conn) - before
+    print(f"{label:<8} {elapsed:8.2f}s  {sent / 1024 / 1024:10.2f} MB 수신  그룹 {len(groups):,}개")
+    return groups, elapsed, sent
+
+
+if __name__ == '__main__':
+    max_id = get_max_transaction_id(engine)
+    print(f"AptTransaction id <= {max_id:,}")
+
+    groups_pd, t_pd, b_pd = measure("pandas", pandas_path, max_id)
+    groups_sql, t_sql, b_sql = measure("sql", sql_path, max_id)
+    print(f"📉 전송량 x{b_pd / max(b_sql, 1):.1f} 감소, 시간 x{t_pd / t_sql:.1f} 단축")
+
+    cmp = groups_pd.merge(groups_sql, on=GROUP_KEYS, how='outer', suffixes=('_pd', '_sql'), indicator=True)
+    diff = cmp[(cmp['_merge'] != 'both') |
+               ((cmp['residence_score_pd'] - cmp['residence_score_sql']).abs() > 0.01) |
+               ((cmp['investment_score_pd'] - cmp['investment_score_sql']).abs() > 0.01)]
+    print("✅ 그룹 점수 일치" if diff.empty else f"❌ 그룹 점수 불일치 {len(diff)}건\n{diff.head()}")
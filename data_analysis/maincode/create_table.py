@@ -2,9 +2,5 @@ from database.handler import Handler
 
 
 if __name__ == '__main__':
-  #DB Table 추가
-  Handler().create_AptTransaction()
-  Handler().create_Infrastructure()
-  Handler().create_BusUsage()
-  Handler().create_PopulationStats()
-  Handler().create_Score()
\ No newline at end of file
+  #DB Table 추가 (연결 하나로 전체 생성)
+  Handler().create_all()
\ No newline at end of file
@@ -0,0 +1,146 @@
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+
+# ========================================
+# database/bulk.py
+#  LOAD DATA LOCAL INFILE 기반 대량 적재
+# ========================================
+
+    # - Norm* 스크립트의 CSV는 이미 MySQL NULL 표기('\N')를 사용하므로 그대로 서버에 스트리밍
+    # - 컬럼 매핑: CSV 컬럼 순서대로 테이블 컬럼명 또는 @변수를 지정하고 SET 절로 파생 컬럼 계산
+    #   (예: AptTransaction의 year는 파일명 연도, source_id는 @변수로 버림)
+    # - dropna / merge가 필요한 테이블은 임시(TEMPORARY) 테이블에 먼저 적재 후 INSERT ... SELECT
+    # - 서버 설정 local_infile=1 필요, 클라이언트는 local_infile=True로 연결
+
+
+def create_bulk_engine(url: str):
+    return create_engine(url, echo=False, connect_args={'local_infile': True})
+
+
+def detect_line_terminator(path: str) -> str:
+    # pandas to_csv는 OS 기본 줄바꿈을 사용 (Windows: \r\n)
+    with open(path, 'rb') as f:
+        head = f.read(1 << 16)
+    return '\\r\\n' if b'\r\n' in head else '\\n'
+
+
+@contextmanager
+def bulk_cursor(engine):
+    """한 연결에서 커서 제공 (임시 테이블은 같은 연결에서만 보임), 정상 종료 시 commit"""
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        yield cur
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def load_data_infile(cur, path: str, table: str, columns: list, set_clause: str = None,
+                     ignore_lines: int = 1) -> int:
+    """
+    CSV 파일을 LOAD DATA LOCAL INFILE로 적재하고 적재 건수 반환
+    - columns: CSV 컬럼 순서대로 테이블 컬럼명 또는 '@변수'
+    - set_clause: 'year = 2022, passengers = @usage_cnt' 형태
+    """
+    # Windows 경로도 '/'로 바꾸고 작은따옴표 이스케이프
+    file_path = path.replace('\\', '/').replace("'", "\\'")
+    target = ', '.join(c if c.startswith('@') else f"`{c}`" for c in columns)
+
+    sql = (
+        f"LOAD DATA LOCAL INFILE '{file_path}' "
+        f"INTO TABLE `{table}` "
+        f"CHARACTER SET utf8mb4 "
+        f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+        f"LINES TERMINATED BY '{detect_line_terminator(path)}' "
+        f"IGNORE {ignore_lines} LINES "
+        f"({target})"
+    )
+    if set_clause:
+        sql += f" SET {set_clause}"
+    cur.execute(sql)
+    return cur.rowcount
+
+
+def report_rate(label: str, rows: int, seconds: float):
+    rate = rows / seconds if seconds > 0 else float('inf')
+    print(f"⏱️ {label}: {rows:,}건 / {seconds:.2f}s = {rate:,.0f} rows/s")
+
+
+# --------------------
+# 테이블별 매핑
+# --------------------
+
+# AptTransaction CSV: 최종 컬럼 순서 (NormAptTransaction.final_cols)
+APT_CSV_COLUMNS = [
+    'sigungu', 'bunji', 'main_num', 'sub_num', 'apt_name', 'area',
+    'contract_ym', 'contract_day', 'price', 'dong', 'floor',
+    'build_year', 'road_name', 'deal_type', 'realtor_area',
+    'registry_date', 'apt_type', '@source_id'
+]
+
+
+def load_apt_transaction(cur, path: str, year: int) -> int:
+    # year는 파일명 연도로 채우고 source_id는 테이블에 없으므로 버림
+    return load_data_infile(cur, path, 'AptTransaction', APT_CSV_COLUMNS, set_clause=f"`year` = {int(year)}")
+
+
+def load_bus_usage(cur, path: str) -> int:
+    # 임시 테이블 적재 → 필수값 있는 행만 BusUsage로 (to_sql 경로의 dropna와 동일)
+    cur.execute("DROP TEMPORARY TABLE IF EXISTS tmp_bus_usage")
+    cur.execute("""
+        CREATE TEMPORARY TABLE tmp_bus_usage (
+            dep VARCHAR(60), arr VARCHAR(60), year INT, month TINYINT,
+            day_type VARCHAR(20), transport_type VARCHAR(20), usage_cnt INT
+        )
+    """)
+    load_data_infile(cur, path, 'tmp_bus_usage',
+                     ['@dep', '@arr', '@year', '@month', '@day_type', '@transport_type', '@usage_cnt'],
+                     set_clause="dep = NULLIF(@dep, ''), arr = NULLIF(@arr, ''), "
+                                "year = NULLIF(@year, ''), month = NULLIF(@month, ''), "
+                                "day_type = NULLIF(@day_type, ''), transport_type = NULLIF(@transport_type, ''), "
+                                "usage_cnt = NULLIF(@usage_cnt, '')")
+    cur.execute("""
+        INSERT INTO BusUsage (sigungu, year, month, day_type, transport_mode, passengers)
+        SELECT dep, year, month, day_type, transport_type, usage_cnt
+        FROM tmp_bus_usage
+        WHERE dep IS NOT NULL AND year IS NOT NULL AND month IS NOT NULL
+          AND day_type IS NOT NULL AND transport_type IS NOT NULL AND usage_cnt IS NOT NULL
+    """)
+    return cur.rowcount
+
+
+def load_agency(cur, path: str):
+    # PopulationStats 적재 시 agency_code → sigungu 매핑용 임시 테이블
+    cur.execute("DROP TEMPORARY TABLE IF EXISTS tmp_agency")
+    cur.execute("CREATE TEMPORARY TABLE tmp_agency (agency_code BIGINT, name VARCHAR(60), INDEX (agency_code))")
+    load_data_infile(cur, path, 'tmp_agency', ['agency_code', 'name'])
+
+
+def load_population_stats(cur, path: str) -> int:
+    # 임시 테이블 적재 → tmp_agency와 조인해 sigungu 채운 뒤 PopulationStats로 (load_agency 먼저 호출)
+    cur.execute("DROP TEMPORARY TABLE IF EXISTS tmp_population")
+    cur.execute("""
+        CREATE TEMPORARY TABLE tmp_population (
+            agency_code BIGINT, year INT, month TINYINT, total_pop INT, household INT,
+            pop_per_household DECIMAL(5,2), male INT, female INT, ratio DECIMAL(5,2)
+        )
+    """)
+    cols = ['agency_code', 'year', 'month', 'total_pop', 'household',
+            'pop_per_household', 'male', 'female', 'ratio']
+    load_data_infile(cur, path, 'tmp_population', [f"@{c}" for c in cols],
+                     set_clause=', '.join(f"{c} = NULLIF(@{c}, '')" for c in cols))
+    cur.execute("""
+        INSERT INTO PopulationStats
+            (sigungu, year, month, male, female, total_population, gender_ratio, household_population)
+        SELECT a.name, p.year, p.month, p.male, p.female, p.total_pop, p.ratio, p.pop_per_household
+        FROM tmp_population p
+        JOIN (SELECT DISTINCT agency_code, name FROM tmp_agency) a ON a.agency_code = p.agency_code
+        WHERE a.name IS NOT NULL AND p.year IS NOT NULL AND p.month IS NOT NULL
+          AND p.male IS NOT NULL AND p.female IS NOT NULL AND p.total_pop IS NOT NULL
+    """)
+    return cur.rowcount
@@ -1,54 +1,281 @@
 import MySQLdb
+import queue
+import re
+import threading
 import time
+from contextlib import contextmanager
+
+# 연결 정보
+DB_CONFIG = dict(host='localhost', user='root', passwd='1234', db='Apartment-transaction', charset='UTF8')
+
+# 연결 끊김(OperationalError) 시 최대 RETRIES번 실행, 대기: 0.3s, 0.6s, 1.2s ... (최대 5s)
+RETRIES = 3
+BACKOFF_BASE = 0.3
+BACKOFF_MAX = 5.0
+
+# 연결당 서버 측 prepared statement 최대 개수 (초과 시 가장 오래된 것부터 DEALLOCATE)
+PREPARED_CACHE_SIZE = 64
+
+IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def quote_ident(name: str) -> str:
+    # 테이블/컬럼명은 파라미터로 바인딩할 수 없으므로 형식 검사 후 백틱으로 감쌈
+    if not IDENT_RE.match(name):
+        raise ValueError(f"invalid identifier: {name!r}")
+    return f"`{name}`"
+
+
+def where_clause(where: dict) -> tuple:
+    # {'sigungu': '경기도 수원시', 'year': 2024} → ("WHERE `sigungu` = ? AND `year` = ?", [값...])
+    if not where:
+        return "", []
+    return "WHERE " + " AND ".join(f"{quote_ident(c)} = ?" for c in where), list(where.values())
+
+
+class ConnectionPool:
+    """
+    MySQLdb 연결 풀
+    - 반납된 연결은 닫지 않고 재사용 (쿼리마다 connect/close 하지 않음)
+    - 대여 시 ping_interval초 이상 쉬었던 연결은 ping으로 상태 확인, 끊겼으면 새로 연결
+    - 동시에 빌려줄 수 있는 연결은 최대 size개 (초과 요청은 반납될 때까지 대기)
+    """
+    def __init__(self, size: int = 5, ping_interval: float = 30.0, **config):
+        self.config = config or DB_CONFIG
+        self.ping_interval = ping_interval
+        self.idle = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(size)
+
+    def _new(self):
+        return MySQLdb.connect(**self.config)
+
+    def _healthy(self, conn) -> bool:
+        try:
+            conn.ping()
+            return True
+        except MySQLdb.Error:
+            return False
+
+    def acquire(self):
+        self.slots.acquire()
+        try:
+            while True:
+                try:
+                    conn, last_used = self.idle.get_nowait()
+                except queue.Empty:
+                    return self._new()
+                if time.monotonic() - last_used < self.ping_interval or self._healthy(conn):
+                    return conn
+                self.discard(conn)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def release(self, conn, broken: bool = False):
+        if broken:
+            self.discard(conn)
+        else:
+            self.idle.put((conn, time.monotonic()))
+        self.slots.release()
+
+    def discard(self, conn):
+        try:
+            conn.close()
+        except MySQLdb.Error:
+            pass
+
+    def close(self):
+        while True:
+            try:
+                conn, _ = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(conn)
+
+
+# 모듈 전역 풀 (DB/Query/Handler 인스턴스가 공유)
+pool = ConnectionPool()
+
 
 class DB:
+    conn = None
+    in_session = False
+    description = None
+
     def connect(self):
-        self.conn = MySQLdb.connect(host='localhost', user='root', passwd='1234', db='Apartment-transaction', charset='UTF8')
+        self.conn = pool.acquire()
+
+    def execute_prepared(self, query: str, params=None):
+        """
+        서버 측 prepared statement로 실행 (placeholder는 '?')
+        - 같은 SQL 문은 연결마다 한 번만 PREPARE, 이후 호출은 EXECUTE ... USING만 전송
+        - 캐시는 연결 객체에 붙어 있어 풀에서 같은 연결을 다시 빌리면 재사용됨
+        """
+        cache = self.conn.__dict__.setdefault('prepared', {})
+        cur = self.conn.cursor()
+
+        name = cache.pop(query, None)
+        if name is None:
+            if len(cache) >= PREPARED_CACHE_SIZE:
+                oldest = next(iter(cache))
+                cur.execute(f"DEALLOCATE PREPARE {cache.pop(oldest)}")
+            seq = self.conn.__dict__.get('prepared_seq', 0)
+            self.conn.prepared_seq = seq + 1
+            name = f"stmt_{seq}"
+            cur.execute(f"PREPARE {name} FROM %s", (query,))
+        cache[query] = name  # 최근 사용 순서 유지
 
-    def execute(self, query: str, retry=1):
+        try:
+            if params:
+                variables = [f"@p{i}" for i in range(len(params))]
+                cur.execute("SET " + ", ".join(f"{v} = %s" for v in variables), tuple(params))
+                cur.execute(f"EXECUTE {name} USING {', '.join(variables)}")
+            else:
+                cur.execute(f"EXECUTE {name}")
+        except Exception:
+            # 서버에서 문장이 사라졌을 수 있으므로 다음 호출 때 다시 PREPARE
+            cache.pop(query, None)
+            raise
+        self.description = cur.description
+        return cur.fetchall()
+
+    def execute(self, query: str, params=None, many: bool = False, prepared: bool = False):
+        # 현재 연결에서 한 번 실행 (재시도는 retrying이 세션 단위로)
         if not query:
             return
+        if prepared:
+            return self.execute_prepared(query, params)
+        cur = self.conn.cursor()
+        if many:
+            cur.executemany(query, params)
+        else:
+            cur.execute(query, params)
+        self.description = cur.description
+        return cur.fetchall()
 
-        count = 0
-        while count < retry:
+    def retrying(self, run):
+        """
+        새 세션(새 연결, 새 트랜잭션)에서 run() 실행, 연결 끊김(OperationalError)이면 대기 후 다시 실행
+        - 끊긴 연결은 풀에 반납하지 않고 버림 (session 참고)
+        - 바깥 세션 안에서 호출되면 트랜잭션이 이미 깨졌으므로 재시도 없이 그대로 raise
+        - COMMIT 중 끊김은 재시도하지 않음 (서버에 이미 반영됐을 수 있어 INSERT 재실행 시 중복)
+        """
+        attempts = 1 if self.in_session else RETRIES
+        for attempt in range(1, attempts + 1):
+            executed = False
             try:
-                cur = self.conn.cursor()
-                cur.execute(query)
-                return cur.fetchall()
-            except Exception as ex:
-                time.sleep(0.3)
+                with self.session():
+                    result = run()
+                    executed = True
+                return result
+            except MySQLdb.OperationalError:
+                if executed or attempt >= attempts:
+                    raise
+                time.sleep(min(BACKOFF_BASE * 2 ** (attempt - 1), BACKOFF_MAX))
+
+    def disconnect(self, commit: bool = True, broken: bool = False):
+        if broken:
+            pool.release(self.conn, broken=True)
+            self.conn = None
+            return
+        try:
+            if commit:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+            pool.release(self.conn)
+        except MySQLdb.Error:
+            pool.release(self.conn, broken=True)
+            if commit:
+                raise
+        finally:
+            self.conn = None
 
-                count += 1
-                if count >= retry:
-                    raise Exception(ex)
+    @contextmanager
+    def session(self):
+        """
+        with 블록 안의 모든 쿼리를 연결 하나, 트랜잭션 하나로 실행
+        - 정상 종료 시 commit, 예외 시 rollback
+        - 중첩 호출 시 바깥 세션을 그대로 사용
+        - OperationalError(연결 끊김)면 rollback 없이 연결을 버림
+        """
+        if self.in_session:
+            yield self
+            return
 
-    def disconnect(self):
-        self.conn.commit()
-        self.conn.close()
+        self.connect()
+        self.in_session = True
+        try:
+            yield self
+        except Exception as ex:
+            self.in_session = False
+            self.disconnect(commit=False, broken=isinstance(ex, MySQLdb.OperationalError))
+            raise
+        self.in_session = False
+        self.disconnect()
 
     def handle(func):
         def wrapper(self, *args, **kwargs):
-            self.connect()
-            row = self.execute(func(*args, **kwargs))
-            self.disconnect()
-            return row
+            query = func(*args, **kwargs)
+            # Query 메서드 반환값
+            #  - SQL 문자열: 그대로 실행 (DDL)
+            #  - (SQL, 파라미터): '?' placeholder → 서버 측 prepared statement
+            #  - (SQL, 행 목록, True): '%s' placeholder → executemany
+            def run():
+                if not isinstance(query, tuple):
+                    return self.execute(query)
+                if len(query) == 3:
+                    return self.execute(query[0], query[1], many=True)
+                return self.execute(query[0], query[1], prepared=True)
+            return self.retrying(run)
         return wrapper
 
 class Query(DB):
     @DB.handle
-    def create(table: str, options: list):
-        return f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(options)});"
+    def create(table: str, options: list, partition: str=None):
+        # partition: 'PARTITION BY RANGE (`year`) (...)' 형태 (테이블 옵션으로 뒤에 붙임)
+        sql = f"CREATE TABLE IF NOT EXISTS {quote_ident(table)} ({', '.join(options)})"
+        return f"{sql} {partition};" if partition else f"{sql};"
 
     @DB.handle
-    def select(table: str, columns: list, where: list=None):
-        if not where:
-            return f"SELECT {', '.join(columns)} FROM {table};"
-        return f"SELECT {', '.join(columns)} FROM {table} WHERE {' AND '.join(where)};"
+    def select(table: str, columns: list, where: dict=None, order_by: str=None, desc: bool=False, limit: int=None):
+        cond, params = where_clause(where)
+        sql = f"SELECT {', '.join(quote_ident(c) for c in columns)} FROM {quote_ident(table)} {cond}"
+        if order_by:
+            sql += f" ORDER BY {quote_ident(order_by)}{' DESC' if desc else ''}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return sql, params
 
     @DB.handle
     def insert(table: str, columns: list, values: list):
-        return f"INSERT INTO {table}({', '.join(columns)}) VALUES({', '.join(values)});"
+        placeholders = ', '.join(['?'] * len(columns))
+        return f"INSERT INTO {quote_ident(table)}({', '.join(quote_ident(c) for c in columns)}) VALUES({placeholders})", list(values)
+
+    @DB.handle
+    def insert_many(table: str, columns: list, rows: list):
+        # rows: [(값1, 값2, ...), ...] → executemany가 다중 행 INSERT 하나로 묶어 전송
+        placeholders = ', '.join(['%s'] * len(columns))
+        return f"INSERT INTO {quote_ident(table)}({', '.join(quote_ident(c) for c in columns)}) VALUES({placeholders});", rows, True
+
+    @DB.handle
+    def delete(table:str, where: dict):
+        if not where:
+            raise ValueError("delete without where")
+        cond, params = where_clause(where)
+        return f"DELETE FROM {quote_ident(table)} {cond}", params
 
     @DB.handle
-    def delete(table:str, where: list):
-        return f"DELETE FROM {table} WHERE {' AND '.join(where)};"
+    def query(sql: str, params: list=None):
+        # 조인/집계 등 임의 SQL ('?' placeholder, 서버 측 prepared statement 재사용)
+        return sql, list(params or [])
+
+    def fetch(self, sql: str, params: list=None):
+        """query()와 같지만 (컬럼명 목록, 행 목록) 반환 → pd.DataFrame(rows, columns=columns)"""
+        rows = self.query(sql, params)
+        return [d[0] for d in self.description or []], rows
+
+    def execute_many(self, statements: list):
+        """여러 SQL 문을 연결 하나, 트랜잭션 하나로 실행 (하나라도 실패하면 전부 rollback)"""
+        return self.retrying(lambda: [self.execute(sql) for sql in statements])
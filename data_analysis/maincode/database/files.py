@@ -0,0 +1,19 @@
+import os
+import pandas as pd
+
+
+def preprocessed_path(base_dir: str, name: str, fmt: str = 'csv') -> str:
+    # 'AptTransaction_2022_preprocessed' → base_dir/AptTransaction_2022_preprocessed.{csv|parquet}
+    return os.path.join(base_dir, f"{name}.{fmt}")
+
+
+def read_preprocessed(path: str, **csv_kwargs) -> pd.DataFrame:
+    """
+    전처리 결과 로드
+    - .parquet: 저장된 타입(nullable int, date, category) 그대로 로드, 문자열 재파싱 없음
+    - .csv: '\\N'을 결측으로 읽음 (Norm* 스크립트의 MySQL NULL 표기)
+    """
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    csv_kwargs.setdefault('na_values', ['\\N'])
+    return pd.read_csv(path, **csv_kwargs)
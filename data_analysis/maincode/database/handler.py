@@ -1,11 +1,47 @@
-from database.db import Query
+from database.db import Query, quote_ident
+from scoring import COMPONENTS
+
+# 구성 점수 컬럼 (scoring.COMPONENTS, 목적별 점수는 이 컬럼들의 가중합)
+def component_columns():
+    return [f"`{c}` FLOAT NOT NULL DEFAULT 0" for c in COMPONENTS]
+
+# 연도별 RANGE 파티션 범위 (범위 밖 연도는 p_old / p_future로)
+PARTITION_YEARS = range(2015, 2026)
+
+def partition_name(year: int) -> str:
+    return f"p{int(year)}"
+
+def year_partitions(years=PARTITION_YEARS) -> str:
+    # 한 해 = 파티션 하나 → 연도 재적재 시 DELETE 대신 TRUNCATE PARTITION
+    parts = [f"PARTITION p_old VALUES LESS THAN ({years[0]})"]
+    parts += [f"PARTITION {partition_name(y)} VALUES LESS THAN ({y + 1})" for y in years]
+    parts.append("PARTITION p_future VALUES LESS THAN MAXVALUE")
+    return f"PARTITION BY RANGE (`year`) ({', '.join(parts)})"
 
 class Handler(Query):
+    def create_Region(self):
+        # 시군구 차원 테이블 (insert_Region.py가 Agency_preprocessed로 시드)
+        # 사실 테이블은 sigungu 원문과 함께 region_id(SMALLINT)를 저장, 집계/조인은 region_id로
+        self.create(table='Region', options=[
+      			"`region_id` SMALLINT PRIMARY KEY",
+      			"`name` VARCHAR(60) NOT NULL",                 # 표준명 (예: 경기도 수원시)
+      			"`agency_code` BIGINT",                        # 대표 행정기관 코드
+      			"UNIQUE KEY `uk_name` (`name`)"
+        ])
+        self.create(table='RegionAlias', options=[
+      			"`alias` VARCHAR(60) PRIMARY KEY",             # 원본 데이터 표기 (행정기관명 / 시·군명)
+      			"`region_id` SMALLINT NOT NULL",
+      			"INDEX `idx_region` (`region_id`)"
+        ])
+
+    # 파티션 테이블의 기본키/유니크 키는 파티션 컬럼(year)을 포함해야 함 → PRIMARY KEY (id, year)
+    # id가 복합키의 첫 컬럼이므로 id 단독 조회(Score ⋈ AptTransaction)도 기본키로 처리
     def create_AptTransaction(self):
         options = [
-      			"`id` INT AUTO_INCREMENT PRIMARY KEY",
+      			"`id` INT AUTO_INCREMENT",
       			"`year` INT NOT NULL",                
       			"`sigungu` VARCHAR(60) NOT NULL",        
+      			"`region_id` SMALLINT",                   # Region.region_id (적재 시 변환)
       			"`bunji` VARCHAR(30) NOT NULL",          
       			"`main_num` VARCHAR(10) NOT NULL",       
       			"`sub_num` VARCHAR(10) NOT NULL",        
@@ -21,56 +57,153 @@ class Handler(Query):
       			"`deal_type` VARCHAR(20)",              
       			"`realtor_area` VARCHAR(100)",          
       			"`registry_date` DATE",                  
-      			"`apt_type` VARCHAR(20)"
+      			"`apt_type` VARCHAR(20)",
+      			"PRIMARY KEY (`id`, `year`)",
+      			"INDEX `idx_sigungu_year` (`sigungu`, `year`)",
+      			"INDEX `idx_region_year` (`region_id`, `year`)"         # 점수 계산 그룹화 (정수 키)
         ]
-        self.create(table='AptTransaction', options=options)
+        self.create(table='AptTransaction', options=options, partition=year_partitions())
         
     def create_Infrastructure(self):
         options = [
       			"`id` INT AUTO_INCREMENT PRIMARY KEY",             
       			"`sigungu` VARCHAR(60) NOT NULL",                   
+      			"`region_id` SMALLINT",
       			"`dong` VARCHAR(20) NOT NULL",           
       			"`infra_type` VARCHAR(50) NOT NULL",                               
       			"`facility_name` VARCHAR(100) NOT NULL",                   
       			"`latitude` DECIMAL(10,7)",                               
-      			"`longitude` DECIMAL(10,7)"              
+      			"`longitude` DECIMAL(10,7)",
+      			"INDEX `idx_sigungu_type` (`sigungu`, `infra_type`)",    # 시군구별 시설 조회
+      			"INDEX `idx_region_type` (`region_id`, `infra_type`)"      # 지역별 유형 집계
         ]
         self.create(table='Infrastructure', options=options)
         
     def create_BusUsage(self):
         options = [
-      			"`id` INT AUTO_INCREMENT PRIMARY KEY",             
+      			"`id` INT AUTO_INCREMENT",             
       			"`sigungu` VARCHAR(60) NOT NULL",                   
+      			"`region_id` SMALLINT",
                 "`year` INT NOT NULL",  
                 "`month` TINYINT NOT NULL",           
       			"`day_type` VARCHAR(20) NOT NULL",                               
       			"`transport_mode` VARCHAR(20) NOT NULL",                   
-      			"`passengers` INT NOT NULL"                                        
+      			"`passengers` INT NOT NULL",
+      			"PRIMARY KEY (`id`, `year`)",
+      			"INDEX `idx_sigungu_year_month` (`sigungu`, `year`, `month`, `passengers`)",    # 시군구·월별 조회 (main.py)
+      			"INDEX `idx_region_year` (`region_id`, `year`, `passengers`)"     # 커버링: 지역·연도별 합계
         ]
-        self.create(table='BusUsage', options=options)		
+        self.create(table='BusUsage', options=options, partition=year_partitions())		
         
     def create_PopulationStats(self):
         options = [
-      			"`id` INT AUTO_INCREMENT PRIMARY KEY",             
+      			"`id` INT AUTO_INCREMENT",             
       			"`sigungu` VARCHAR(60) NOT NULL",                   
+      			"`region_id` SMALLINT",
                 "`year` INT NOT NULL",  
                 "`month` TINYINT NOT NULL",    
                 "`male` VARCHAR(10) NOT NULL", 
                 "`female` VARCHAR(10) NOT NULL", 
                 "`total_population` INT NOT NULL", 
                 "`gender_ratio` DECIMAL(5,2)", 
-                "`household_population` DECIMAL(5,2)"                                     
+                "`household_population` DECIMAL(5,2)",
+                "PRIMARY KEY (`id`, `year`)",
+                "INDEX `idx_sigungu_year` (`sigungu`, `year`, `total_population`)",
+                "INDEX `idx_region_year` (`region_id`, `year`, `total_population`)"     # 커버링: 인구 점수 집계
         ]
-        self.create(table='PopulationStats', options=options)	
+        self.create(table='PopulationStats', options=options, partition=year_partitions())	
         
     def create_Score(self):
         options = [
-      			"`id` INT AUTO_INCREMENT PRIMARY KEY",
+      			"`id` INT AUTO_INCREMENT",
       			"`AptTransaction_id` INT NOT NULL",
       			"`year` INT NOT NULL",                
       			"`sigungu` VARCHAR(60) NOT NULL",     
+      			"`region_id` SMALLINT NOT NULL",
+      			*component_columns(),
       			"`residence_score` FLOAT NOT NULL",
-      			"`investment_score` FLOAT NOT NULL"                                      
+      			"`investment_score` FLOAT NOT NULL",
+      			"PRIMARY KEY (`id`, `year`)",
+      			"INDEX `idx_txn` (`AptTransaction_id`)",                              # Score ⋈ AptTransaction, 중복 확인
+      			"INDEX `idx_region_year` (`region_id`, `year`)",                     # 증분 계산 그룹 점수 UPDATE
+      			"INDEX `idx_sigungu_residence` (`sigungu`, `residence_score`)",       # 시군구 Top10 (실거주)
+      			"INDEX `idx_sigungu_investment` (`sigungu`, `investment_score`)"      # 시군구 Top10 (투자)
         ]
-        self.create(table='Score', options=options)	
+        self.create(table='Score', options=options, partition=year_partitions())
+
+    def create_ScoreTopN(self):
+        # 시군구·목적·연도별 추천 Top-N (insert_Score.py가 점수 갱신 시 재생성)
+        # purpose: scoring.PROFILES 번호 (1 실거주 / 2 투자 / ...), year: 0 = 전체 연도
+        options = [
+      			"`sigungu` VARCHAR(60) NOT NULL",
+      			"`purpose` TINYINT NOT NULL",
+      			"`year` INT NOT NULL",
+      			"`rank_no` TINYINT NOT NULL",
+      			"`AptTransaction_id` INT NOT NULL",
+      			"`txn_year` INT NOT NULL",
+      			"`apt_name` VARCHAR(100) NOT NULL",
+      			"`area` FLOAT NOT NULL",
+      			"`price` INT NOT NULL",
+      			"`build_year` INT",
+      			"`road_name` VARCHAR(100)",
+      			"`apt_sigungu` VARCHAR(60) NOT NULL",          # AptTransaction.sigungu (읍면동까지, 좌표 대체 조회용)
+      			"`score` FLOAT NOT NULL",
+      			"PRIMARY KEY (`sigungu`, `purpose`, `year`, `rank_no`)"
+        ]
+        self.create(table='ScoreTopN', options=options)
+
+    def create_InfraGrid(self):
+        # Infrastructure 다중 해상도 격자 집계 (insert_InfraGrid.py가 재생성, 해상도/셀 크기는 infra_grid.GRID_LEVELS)
+        # 화면 범위 조회: resolution 고정 + cell_y 범위 → 기본키 범위 스캔
+        options = [
+      			"`resolution` TINYINT NOT NULL",
+      			"`cell_y` INT NOT NULL",                        # floor(위도 / 셀 크기)
+      			"`cell_x` INT NOT NULL",                        # floor(경도 / 셀 크기)
+      			"`facility_type` VARCHAR(10) NOT NULL",         # accessibility.classify_infra (school / hospital / park / other)
+      			"`facility_count` INT NOT NULL",
+      			"PRIMARY KEY (`resolution`, `cell_y`, `cell_x`, `facility_type`)"
+        ]
+        self.create(table='InfraGrid', options=options)
+
+    def create_ScoreState(self):
+        # insert_Score.py --incremental 상태 (마지막 거래 id / 그룹 통계 / 그룹 점수)
+        self.create(table='ScoreMeta', options=[
+      			"`name` VARCHAR(40) PRIMARY KEY",
+      			"`value` BIGINT NOT NULL"
+        ])
+        self.create(table='ScoreGroupStats', options=[
+      			"`region_id` SMALLINT NOT NULL",
+      			"`year` INT NOT NULL",
+      			"`cnt` INT NOT NULL",
+      			"`sum_price` DOUBLE NOT NULL",
+      			"`sum_area` DOUBLE NOT NULL",
+      			"`sum_build_year` DOUBLE NOT NULL",
+      			"PRIMARY KEY (`region_id`, `year`)"
+        ])
+        self.create(table='ScoreGroup', options=[
+      			"`region_id` SMALLINT NOT NULL",
+      			"`year` INT NOT NULL",
+      			*component_columns(),
+      			"`residence_score` FLOAT NOT NULL",
+      			"`investment_score` FLOAT NOT NULL",
+      			"PRIMARY KEY (`region_id`, `year`)"
+        ])
+
+    def create_all(self):
+        # 연결 하나로 전체 테이블 생성 (테이블마다 재연결하지 않음)
+        with self.session():
+            self.create_Region()
+            self.create_AptTransaction()
+            self.create_Infrastructure()
+            self.create_BusUsage()
+            self.create_PopulationStats()
+            self.create_Score()
+            self.create_ScoreTopN()
+            self.create_ScoreState()
+            self.create_InfraGrid()
 
+    def truncate_year(self, table: str, year: int):
+        # 해당 연도 파티션만 비움 (행 단위 DELETE ... WHERE year= 대신 파티션 메타데이터 작업)
+        if int(year) not in PARTITION_YEARS:
+            raise ValueError(f"{table}: {year}년 파티션 없음 (PARTITION_YEARS 범위 확인)")
+        self.execute_many([f"ALTER TABLE {quote_ident(table)} TRUNCATE PARTITION {partition_name(year)}"])
@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from sqlalchemy import create_engine
+
+# ========================================
+# database/parallel.py
+#  DataFrame을 청크로 나눠 여러 연결에서 동시에 INSERT
+# ========================================
+
+    # - 연결 풀 크기 = 작업 스레드 수 (풀에서 연결을 빌려 청크 하나 처리 후 반납)
+    # - 청크마다 executemany → pymysql이 다중 행 INSERT ... VALUES (...), (...) 로 묶어 전송
+    # - 청크마다 별도 commit (긴 트랜잭션 하나 대신 짧은 트랜잭션 여러 개)
+    # - NaN/NaT/pd.NA는 None으로 바꿔 NULL 저장
+
+
+def create_pool_engine(url: str, workers: int):
+    return create_engine(url, echo=False, pool_size=workers, max_overflow=0, pool_pre_ping=True)
+
+
+def to_rows(df: pd.DataFrame) -> list:
+    # numpy 스칼라 → 파이썬 객체, 결측 → None
+    obj = df.astype(object)
+    return list(obj.where(obj.notna(), None).itertuples(index=False, name=None))
+
+
+def insert_chunk(engine, sql: str, rows: list) -> int:
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.executemany(sql, rows)
+        conn.commit()
+        return len(rows)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def parallel_insert(engine, table: str, df: pd.DataFrame, chunksize: int = 5000, workers: int = 4) -> int:
+    """
+    df를 chunksize 행씩 나눠 workers개의 연결로 동시에 INSERT
+    - engine은 create_pool_engine(url, workers)로 만든 것 사용 권장
+    - 반환: 삽입 건수
+    """
+    if df.empty:
+        return 0
+
+    columns = ', '.join(f"`{c}`" for c in df.columns)
+    placeholders = ', '.join(['%s'] * len(df.columns))
+    sql = f"INSERT INTO `{table}` ({columns}) VALUES ({placeholders})"
+
+    chunks = [df.iloc[i:i + chunksize] for i in range(0, len(df), chunksize)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 행 변환도 워커에서 (pandas 변환 중 GIL 해제 구간과 네트워크 대기가 겹침)
+        futures = [pool.submit(lambda c: insert_chunk(engine, sql, to_rows(c)), chunk) for chunk in chunks]
+        return sum(f.result() for f in futures)
+
+
+def timed_parallel_insert(engine, table: str, df: pd.DataFrame, chunksize: int = 5000, workers: int = 4):
+    """parallel_insert + 소요 시간(초) 반환"""
+    start = time.perf_counter()
+    rows = parallel_insert(engine, table, df, chunksize, workers)
+    return rows, time.perf_counter() - start
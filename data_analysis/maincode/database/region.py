@@ -0,0 +1,122 @@
+import pandas as pd
+from sqlalchemy import text
+
+from address import CITY_RE, region_name, region_names
+
+# ========================================
+# database/region.py
+#  시군구 이름 → 정수 region_id 변환 (Region / RegionAlias 차원 테이블)
+# ========================================
+
+    # - Region: 시/군 단위 표준 지역 하나당 한 행 ('경기도 수원시'), region_id는 SMALLINT
+    #   Agency_preprocessed의 agency_code(행정기관 코드) 중 가장 작은 값 = 해당 시/군 기관 코드
+    # - RegionAlias: 원본 데이터에 나오는 표기 → region_id
+    #   (행정기관명 '경기도 수원시 장안구', 표준명 '경기도 수원시', 시/군명 '수원시')
+    # - 적재 스크립트는 고유 이름만 한 번씩 변환해서 region_id 컬럼을 채움
+    #   (행마다 정규식을 돌리지 않고, 점수 계산 조인은 정수 키로 처리)
+    # - insert_Region.py로 먼저 시드해야 함, 기존 region_id는 재시드해도 유지
+    # - 표준명 변환은 address.region_name ('경기도 수원시 장안구 정자동' → '경기도 수원시')
+
+
+def build_regions(agency_df: pd.DataFrame, existing: pd.DataFrame = None):
+    """
+    agency_df(agency_code, name) → (regions, aliases)
+    - regions: region_id, name, agency_code
+    - aliases: alias, region_id
+    existing(Region 테이블 내용)가 있으면 같은 이름은 기존 region_id를 그대로 사용, 새 지역만 뒤에 번호 부여
+    """
+    agency = agency_df[['agency_code', 'name']].dropna().drop_duplicates().copy()
+    agency['name'] = agency['name'].str.replace(r'\s+', ' ', regex=True).str.strip()
+    agency['region'] = region_names(agency['name'])
+
+    regions = agency.groupby('region', as_index=False)['agency_code'].min() \
+                    .rename(columns={'region': 'name'}).sort_values('agency_code', kind='mergesort')
+
+    ids = {} if existing is None else dict(zip(existing['name'], existing['region_id']))
+    next_id = max(ids.values(), default=0) + 1
+    for name in regions['name']:
+        if name not in ids:
+            ids[name] = next_id
+            next_id += 1
+    regions['region_id'] = regions['name'].map(ids).astype(int)
+    regions = regions[['region_id', 'name', 'agency_code']].reset_index(drop=True)
+
+    # 별칭: 행정기관명 / 표준명 / 시·군명 (시·군명이 여러 도에 겹치면 별칭에서 제외)
+    names = pd.concat([
+        pd.DataFrame({'alias': agency['name'], 'region': agency['region']}),
+        pd.DataFrame({'alias': regions['name'], 'region': regions['name']}),
+    ])
+    short = pd.DataFrame({'alias': regions['name'].str.split(' ').str[-1], 'region': regions['name']})
+    short = short[short['alias'].str.match(CITY_RE.pattern) & ~short['alias'].duplicated(keep=False)]
+    aliases = pd.concat([names, short]).drop_duplicates('alias')
+    aliases['region_id'] = aliases['region'].map(ids).astype(int)
+    return regions, aliases[['alias', 'region_id']].reset_index(drop=True)
+
+
+def seed_regions(engine, agency_df: pd.DataFrame):
+    """Region / RegionAlias 갱신 (한 트랜잭션), 반환: (지역 수, 별칭 수)"""
+    existing = pd.read_sql("SELECT region_id, name FROM Region", engine)
+    regions, aliases = build_regions(agency_df, existing)
+    with engine.begin() as conn:
+        conn.execute(text("REPLACE INTO Region (region_id, name, agency_code) VALUES (:region_id, :name, :agency_code)"),
+                     regions.astype(object).to_dict('records'))
+        conn.execute(text("DELETE FROM RegionAlias"))
+        conn.execute(text("INSERT INTO RegionAlias (alias, region_id) VALUES (:alias, :region_id)"),
+                     aliases.astype(object).to_dict('records'))
+    return len(regions), len(aliases)
+
+
+class RegionResolver:
+    """RegionAlias를 한 번 읽어 dict로 보관, 이름 → region_id"""
+    def __init__(self, engine):
+        aliases = pd.read_sql("SELECT alias, region_id FROM RegionAlias", engine)
+        self.aliases = {a: int(r) for a, r in zip(aliases['alias'], aliases['region_id'])}
+        if not self.aliases:
+            print("⚠️ RegionAlias 비어 있음: insert_Region.py를 먼저 실행하세요 (region_id가 NULL로 적재됨)")
+
+    def lookup(self, name):
+        """별칭 일치 → 표준명 일치 → 토큰 중 시/군명 일치 → None"""
+        if not isinstance(name, str):
+            return None
+        name = ' '.join(name.split())
+        for key in (name, region_name(name)):
+            if key in self.aliases:
+                return self.aliases[key]
+        for tok in name.split(' '):
+            if CITY_RE.match(tok) and tok in self.aliases:
+                return self.aliases[tok]
+        return None
+
+    def mapping(self, names) -> dict:
+        return {name: self.lookup(name) for name in pd.unique(pd.Series(list(names), dtype=object).dropna())}
+
+    def resolve(self, names: pd.Series, label: str = '') -> pd.Series:
+        """이름 Series → region_id Series (nullable Int64), 고유 이름만 변환"""
+        mapping = self.mapping(names)
+        missing = [n for n, rid in mapping.items() if rid is None]
+        if missing:
+            print(f"⚠️ {label} 지역 미확인 {len(missing)}개 (예: {', '.join(map(str, missing[:3]))})")
+        return names.map(mapping).astype('Int64')
+
+
+def assign_region_ids(cur, table: str, resolver: RegionResolver) -> int:
+    """
+    LOAD DATA 경로용: region_id가 비어 있는 행의 sigungu를 고유값 단위로 변환 후 조인 UPDATE
+    (cur는 bulk_cursor의 DB-API 커서)
+    """
+    cur.execute(f"SELECT DISTINCT sigungu FROM `{table}` WHERE region_id IS NULL")
+    mapping = {name: rid for name, rid in resolver.mapping(row[0] for row in cur.fetchall()).items()
+               if rid is not None}
+    if not mapping:
+        return 0
+    cur.execute("DROP TEMPORARY TABLE IF EXISTS tmp_region_map")
+    cur.execute("CREATE TEMPORARY TABLE tmp_region_map (name VARCHAR(60) PRIMARY KEY, region_id SMALLINT)")
+    cur.executemany("INSERT INTO tmp_region_map VALUES (%s, %s)", list(mapping.items()))
+    cur.execute(f"""
+        UPDATE `{table}` t JOIN tmp_region_map m ON t.sigungu = m.name
+        SET t.region_id = m.region_id
+        WHERE t.region_id IS NULL
+    """)
+    updated = cur.rowcount
+    cur.execute("DROP TEMPORARY TABLE tmp_region_map")
+    return updated
@@ -0,0 +1,159 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+
+# ========================================
+# geocache.py
+#  주소 → (위도, 경도) 지오코딩 + 디스크 캐시(sqlite)
+# ========================================
+
+    # - 캐시 키: 정규화한 '시군구 + 도로명' 문자열 (NFC, 공백 정리)
+    # - TTL 지난 항목은 다시 조회, 찾지 못한 주소(None)도 짧은 TTL로 캐시해 반복 조회 방지
+    #   (백엔드 예외 = 일시적 오류는 캐시하지 않음)
+    # - 캐시에 없는 주소만 모아서 하나의 백엔드 클라이언트로 순차 조회 (요청 간격 제한)
+    # - 백엔드는 address → (lat, lng) 호출 가능 객체면 무엇이든 가능 (Nominatim / 로컬 dict 등)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'geocode_cache.sqlite')
+DEFAULT_TTL_DAYS = 90
+NEGATIVE_TTL_DAYS = 7
+
+
+def normalize_address(address) -> str:
+    if not isinstance(address, str):
+        return ''
+    address = unicodedata.normalize('NFC', address)
+    return re.sub(r'\s+', ' ', address).strip()
+
+
+class RateLimiter:
+    """호출 간 최소 간격 보장 (Nominatim 정책: 초당 1건)"""
+    def __init__(self, min_interval: float = 1.0):
+        self.min_interval = min_interval
+        self.last = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            delay = self.last + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.last = time.monotonic()
+
+
+class NominatimBackend:
+    """geopy Nominatim 클라이언트 하나를 만들어 재사용"""
+    def __init__(self, user_agent: str = 'apt_map', timeout: float = 5):
+        from geopy.geocoders import Nominatim
+        self.client = Nominatim(user_agent=user_agent, timeout=timeout)
+
+    def __call__(self, address: str):
+        # 네트워크 오류는 그대로 raise → Geocoder가 캐시하지 않음
+        location = self.client.geocode(address)
+        if location:
+            return location.latitude, location.longitude
+        return None, None
+
+
+class DictBackend:
+    """네트워크 없이 미리 정한 좌표를 돌려주는 로컬 백엔드 (테스트/오프라인용)"""
+    def __init__(self, table: dict):
+        self.table = {normalize_address(k): v for k, v in table.items()}
+
+    def __call__(self, address: str):
+        return self.table.get(normalize_address(address), (None, None))
+
+
+class GeoCache:
+    """sqlite 기반 주소 좌표 캐시"""
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_days: float = DEFAULT_TTL_DAYS,
+                 negative_ttl_days: float = NEGATIVE_TTL_DAYS):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_days * 86400
+        with self.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS geocode (
+                    address TEXT PRIMARY KEY, lat REAL, lng REAL, updated REAL NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def connect(self):
+        # 블록 종료 시 commit 후 연결 닫기
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: list) -> dict:
+        """TTL 안에 있는 항목만 {key: (lat, lng)}로 반환"""
+        found = {}
+        now = time.time()
+        with self.connect() as conn:
+            # sqlite 변수 개수 제한 고려해 나눠서 조회
+            for i in range(0, len(keys), 500):
+                part = keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT address, lat, lng, updated FROM geocode WHERE address IN ({', '.join('?' * len(part))})",
+                    part).fetchall()
+                for address, lat, lng, updated in rows:
+                    ttl = self.ttl if lat is not None else self.negative_ttl
+                    if now - updated < ttl:
+                        found[address] = (lat, lng)
+        return found
+
+    def put_many(self, items: dict):
+        now = time.time()
+        with self.connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO geocode (address, lat, lng, updated) VALUES (?, ?, ?, ?)",
+                             [(k, lat, lng, now) for k, (lat, lng) in items.items()])
+
+
+class Geocoder:
+    """
+    캐시 우선 지오코더
+    - geocode_many: 중복 제거 → 캐시 일괄 조회 → 미스만 백엔드 순차 조회(간격 제한) → 캐시 일괄 저장
+    - calls: 백엔드 호출 횟수 (같은 지역 재조회 시 0이어야 함)
+    """
+    def __init__(self, cache: GeoCache = None, backend=None, limiter: RateLimiter = None):
+        self.cache = cache or GeoCache()
+        self._backend = backend
+        self.limiter = limiter or RateLimiter()
+        self.calls = 0
+
+    @property
+    def backend(self):
+        # 기본 백엔드(Nominatim)는 처음 미스가 났을 때 생성
+        if self._backend is None:
+            self._backend = NominatimBackend()
+        return self._backend
+
+    def geocode_many(self, addresses) -> list:
+        keys = [normalize_address(a) for a in addresses]
+        unique = sorted({k for k in keys if k})
+        coords = self.cache.get_many(unique)
+
+        misses = [k for k in unique if k not in coords]
+        resolved = {}
+        for key in misses:
+            self.limiter.wait()
+            self.calls += 1
+            try:
+                resolved[key] = self.backend(key)
+            except Exception:
+                # 일시적 오류는 캐시하지 않고 다음 요청 때 다시 조회
+                continue
+        if resolved:
+            self.cache.put_many(resolved)
+            coords.update(resolved)
+
+        return [coords.get(k, (None, None)) for k in keys]
+
+    def geocode(self, address):
+        return self.geocode_many([address])[0]
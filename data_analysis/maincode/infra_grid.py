@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from accessibility import classify_infra
+
+# ========================================
+# infra_grid.py
+#  Infrastructure 다중 해상도 격자 집계 (InfraGrid 테이블, insert_InfraGrid.py가 생성)
+# ========================================
+
+    # - 위경도 정사각 격자: cell_x = floor(경도 / 크기), cell_y = floor(위도 / 크기)
+    # - 해상도별 (시설 유형, 셀) 시설 수 → 축소 지도에서는 점 대신 셀만 전송
+    # - 화면 범위(bounds)가 넓을수록 거친 해상도 → 한 변의 셀 수가 MAX_CELLS_ACROSS 이하로 유지
+    #   (시설이 몇 개든 지도에 들어가는 셀 수는 화면 크기로 상한)
+
+# 해상도 → 셀 크기(도), 위도 기준 약 16km / 4km / 1km
+GRID_LEVELS = {1: 0.16, 2: 0.04, 3: 0.01}
+COARSEST = min(GRID_LEVELS)
+MAX_CELLS_ACROSS = 48
+
+
+def grid_cells(infra_df):
+    # latitude, longitude, infra_type → (resolution, facility_type, cell_x, cell_y, facility_count)
+    df = infra_df.dropna(subset=['latitude', 'longitude'])
+    lat = df['latitude'].astype(float).to_numpy()
+    lng = df['longitude'].astype(float).to_numpy()
+    types = df['infra_type'].astype(str).map(classify_infra).to_numpy()
+
+    frames = []
+    for level, size in GRID_LEVELS.items():
+        cells = pd.DataFrame({
+            'facility_type': types,
+            'cell_x': np.floor(lng / size).astype(int),
+            'cell_y': np.floor(lat / size).astype(int),
+        })
+        counts = cells.groupby(['facility_type', 'cell_x', 'cell_y']).size().rename('facility_count').reset_index()
+        frames.append(counts.assign(resolution=level))
+    return pd.concat(frames, ignore_index=True)[['resolution', 'facility_type', 'cell_x', 'cell_y', 'facility_count']]
+
+
+def choose_level(bounds):
+    # bounds = (south, west, north, east) → 한 변 셀 수가 상한 이하인 가장 세밀한 해상도
+    south, west, north, east = bounds
+    span = max(north - south, east - west)
+    fits = [level for level, size in GRID_LEVELS.items() if span / size <= MAX_CELLS_ACROSS]
+    return max(fits) if fits else COARSEST
+
+
+def cell_range(bounds, level):
+    # 화면 범위를 덮는 셀 번호 범위 (x0, x1, y0, y1)
+    size = GRID_LEVELS[level]
+    south, west, north, east = bounds
+    return (math.floor(west / size), math.floor(east / size),
+            math.floor(south / size), math.floor(north / size))
+
+
+def range_bounds(level, x0, x1, y0, y1):
+    # cell_range의 역: 셀 번호 범위 → (south, west, north, east)
+    size = GRID_LEVELS[level]
+    return y0 * size, x0 * size, (y1 + 1) * size, (x1 + 1) * size
+
+
+def cell_polygon(level, cx, cy):
+    # GeoJSON 좌표 순서 [경도, 위도]
+    size = GRID_LEVELS[level]
+    x, y = cx * size, cy * size
+    return [[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]]
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import quote
+
+# ========================================
+# loadtest_service.py
+#  service.py 부하 테스트: 동시 연결 N개(keep-alive)로 /recommend 반복 요청
+# ========================================
+
+    # - 도시 목록은 /cities에서 받아 (도시, 목적) 조합을 차례로 요청 → 처음엔 캐시 미스, 이후 적중
+    # - 요청별 지연 시간으로 p50 / p99, 전체 처리량(req/s), 캐시 적중률 출력
+    # - 표준 라이브러리만 사용 (asyncio 스트림으로 HTTP/1.1 직접 전송)
+
+
+class Client:
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def get(self, path):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode('utf-8'))
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        body = json.loads(await self.reader.readexactly(length))
+        return status, body
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+async def run(args):
+    probe = Client(args.host, args.port)
+    _, body = await probe.get('/cities')
+    await probe.close()
+    cities = body['cities'][:args.cities] if args.cities else body['cities']
+    if not cities:
+        raise SystemExit("❌ /cities 결과 없음 (ScoreTopN 확인)")
+    targets = [f"/recommend?city={quote(city)}&purpose={p}&year={args.year}" for city in cities for p in args.purposes]
+
+    latencies, hits, errors = [], 0, 0
+    counter = iter(range(args.requests))
+
+    async def worker():
+        nonlocal hits, errors
+        client = Client(args.host, args.port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                status, body = await client.get(targets[i % len(targets)])
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    errors += 1
+                elif body.get('cached'):
+                    hits += 1
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    print(f"요청 {len(latencies):,}건 / 동시 연결 {args.concurrency} / 대상 {len(targets)}개 (도시 {len(cities)} × 목적 {len(args.purposes)})")
+    print(f"⏱️ p50 {percentile(latencies, 50) * 1000:.2f}ms  p99 {percentile(latencies, 99) * 1000:.2f}ms  "
+          f"최대 {max(latencies) * 1000:.2f}ms")
+    print(f"🚀 {len(latencies) / elapsed:,.0f} req/s  캐시 적중 {hits / len(latencies):.1%}  오류 {errors}건")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="추천 서비스 부하 테스트")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--cities', type=int, default=0, help='앞에서부터 N개 도시만 (0 = 전체)')
+    parser.add_argument('--purposes', type=int, nargs='+', default=[1, 2])
+    parser.add_argument('--year', type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,138 @@
+import folium
+from folium.plugins import FastMarkerCluster, MarkerCluster
+
+from accessibility import FACILITY_TYPES, classify_infra
+from infra_grid import GRID_LEVELS, cell_polygon
+
+# ========================================
+# map_layers.py
+#  Infrastructure 마커 레이어 (시설 수천 개 규모)
+# ========================================
+
+    # - fast: 유형별 FastMarkerCluster 하나씩 → 좌표/툴팁 배열만 HTML에 넣고 마커는 브라우저에서 생성
+    #   (행마다 folium.Marker 객체·HTML 조각을 만들지 않음, iterrows 없음)
+    # - 유형별 레이어는 LayerControl로 켜고 끌 수 있음
+    # - marker: 기존 방식 (행마다 folium.Marker, 비교용)
+    # - grid: 축소 지도용, InfraGrid 셀을 유형별 GeoJSON 레이어 하나로 (셀 수는 화면 범위로 상한)
+
+LAYER_LABELS = {'school': '학교', 'hospital': '병원', 'park': '공원', 'other': '기타 시설'}
+LAYER_COLORS = {'school': 'green', 'hospital': 'red', 'park': 'darkgreen', 'other': 'gray'}
+
+# FastMarkerCluster 콜백: row = [lat, lng, tooltip]
+MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {
+        icon: L.AwesomeMarkers.icon({icon: 'info-sign', markerColor: '%s', prefix: 'glyphicon'})
+    });
+    marker.bindTooltip(row[2]);
+    marker.bindPopup(row[2]);
+    return marker;
+}
+"""
+
+
+def infra_points(infra_df):
+    """latitude, longitude, infra_type, facility_name → 유형 컬럼 + [lat, lng, 툴팁] 배열용 DataFrame"""
+    df = infra_df.dropna(subset=['latitude', 'longitude'])
+    return df.assign(
+        latitude=df['latitude'].astype(float),
+        longitude=df['longitude'].astype(float),
+        tooltip=df['infra_type'].astype(str) + ' - ' + df['facility_name'].astype(str),
+        type=df['infra_type'].astype(str).map(classify_infra),
+    )
+
+
+def add_infra_layers(fmap, infra_df):
+    # 유형별 FastMarkerCluster (배열 → 브라우저에서 마커 생성), 레이어 토글
+    points = infra_points(infra_df)
+    for t in FACILITY_TYPES:
+        part = points[points['type'] == t]
+        if part.empty:
+            continue
+        FastMarkerCluster(
+            part[['latitude', 'longitude', 'tooltip']].values.tolist(),
+            callback=MARKER_CALLBACK % LAYER_COLORS[t],
+            name=f"{LAYER_LABELS[t]} ({len(part):,})",
+        ).add_to(fmap)
+    folium.LayerControl(collapsed=False).add_to(fmap)
+
+
+def add_infra_markers(fmap, infra_df):
+    # 기존 방식: 행마다 folium.Marker
+    infra_cluster = MarkerCluster().add_to(fmap)
+    for _, row in infra_df.iterrows():
+        tooltip = f"{row['infra_type']} - {row['facility_name']}"
+        folium.Marker(
+            location=[row['latitude'], row['longitude']],
+            popup=tooltip,
+            tooltip=tooltip,
+            icon=folium.Icon(color='green', icon='info-sign')
+        ).add_to(infra_cluster)
+
+
+def grid_features(cells, level):
+    # 셀 → GeoJSON FeatureCollection (시설 수가 많을수록 진하게, 최대 셀 기준)
+    top = max(int(cells['facility_count'].max()), 1)
+    features = [
+        {
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': cell_polygon(level, cx, cy)},
+            'properties': {'count': int(n), 'opacity': round(0.15 + 0.6 * n / top, 3)},
+        }
+        for cx, cy, n in cells[['cell_x', 'cell_y', 'facility_count']].itertuples(index=False)
+    ]
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def add_grid_layers(fmap, grid):
+    # grid = (해상도, 화면 범위, InfraGrid 셀) → 유형별 GeoJSON 레이어, 레이어 토글
+    level, bounds, cells = grid
+    for t in FACILITY_TYPES:
+        part = cells[cells['facility_type'] == t]
+        if part.empty:
+            continue
+        color = LAYER_COLORS[t]
+        folium.GeoJson(
+            grid_features(part, level),
+            name=f"{LAYER_LABELS[t]} ({int(part['facility_count'].sum()):,}, {GRID_LEVELS[level]}° 격자)",
+            style_function=lambda f, color=color: {
+                'color': color, 'weight': 0.5, 'fillColor': color, 'fillOpacity': f['properties']['opacity'],
+            },
+            tooltip=folium.GeoJsonTooltip(fields=['count'], aliases=[f"{LAYER_LABELS[t]} 수"]),
+        ).add_to(fmap)
+    folium.LayerControl(collapsed=False).add_to(fmap)
+
+
+def add_apartment_markers(fmap, df):
+    # Top10 아파트 (10건, 마커 객체로 충분)
+    apt_cluster = MarkerCluster(name='추천 아파트').add_to(fmap)
+    for _, row in df.dropna(subset=['latitude', 'longitude']).iterrows():
+        tooltip = f"{row['apt_name']} ({row['area']}\u33a1) - {row['price']}\u10d3"
+        folium.Marker(
+            location=[row['latitude'], row['longitude']],
+            popup=tooltip,
+            tooltip=tooltip,
+            icon=folium.Icon(color='blue', icon='home')
+        ).add_to(apt_cluster)
+
+
+def build_map(df, infra_df, fast=True, grid=None):
+    # grid가 있으면 시설 점 대신 격자 레이어, 화면은 grid 범위에 맞춤
+    if grid is not None:
+        south, west, north, east = grid[1]
+        fmap = folium.Map(location=[(south + north) / 2, (west + east) / 2])
+        fmap.fit_bounds([[south, west], [north, east]])
+        add_apartment_markers(fmap, df)
+        add_grid_layers(fmap, grid)
+        return fmap
+
+    # 중심: Top10 좌표 평균 (좌표가 없으면 시설 좌표 평균)
+    center = df if 'latitude' in df.columns and df['latitude'].notna().any() else infra_df
+    fmap = folium.Map(location=[float(center['latitude'].astype(float).mean()),
+                                float(center['longitude'].astype(float).mean())], zoom_start=13)
+    add_apartment_markers(fmap, df)
+    if fast:
+        add_infra_layers(fmap, infra_df)
+    else:
+        add_infra_markers(fmap, infra_df)
+    return fmap
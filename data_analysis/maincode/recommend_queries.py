@@ -0,0 +1,75 @@
+from address import short_city
+from database.db import quote_ident
+from scoring import STORED_PURPOSES, profile_column, score_sql
+
+# ========================================
+# recommend_queries.py
+#  추천 조회 SQL (main.py 동기 Query / service.py 비동기 풀 공용)
+# ========================================
+
+    # - *_sql 함수는 (SQL, 파라미터) 반환, placeholder는 '?' → 실행은 호출 쪽 풀
+    #   main.py: read_query(*top10_sql(...)) / service.py: await pool.fetch(*top10_sql(...))
+    # - 후처리(버스 월평균)는 행 dict 목록 기준 (DataFrame은 to_dict('records'))
+    # - CLI와 HTTP 결과가 어긋나지 않도록 조회 조건은 여기서만 수정
+
+
+def top10_sql(city, purpose, year=0):
+    # insert_Score.py가 만든 ScoreTopN 기본키 조회 (year 0 = 전체 연도)
+    score_column = quote_ident(profile_column(purpose))
+    sql = f"""
+        SELECT sigungu, apt_name, area, price, build_year, road_name, apt_sigungu,
+               score AS {score_column}, txn_year AS year
+        FROM ScoreTopN
+        WHERE sigungu = ? AND purpose = ? AND year = ?
+        ORDER BY rank_no
+    """
+    return sql, [city, int(purpose), int(year)]
+
+
+def score_top10_sql(city, purpose):
+    # ScoreTopN 생성 전 대체: Score ⋈ AptTransaction 정렬 (시군구는 바인딩 → 목적별로 문장 하나씩만 PREPARE)
+    # 저장된 목적(실거주/투자)은 Score 컬럼 그대로 정렬 → idx_sigungu_residence / idx_sigungu_investment 사용
+    # 나머지 목적만 구성 점수 식으로 계산 (인덱스 없음, 시군구 내 정렬)
+    score_column = quote_ident(profile_column(purpose))
+    score_expr = f"s.{score_column}" if purpose in STORED_PURPOSES else score_sql(purpose)
+    sql = f"""
+        SELECT s.sigungu, a.apt_name, a.area, a.price, a.build_year,
+               a.road_name, a.sigungu AS apt_sigungu, ROUND({score_expr}, 2) AS {score_column}, s.year
+        FROM Score s
+        JOIN AptTransaction a ON s.AptTransaction_id = a.id AND a.year = s.year
+        WHERE s.sigungu = ?
+        ORDER BY {score_expr} DESC
+        LIMIT 10
+    """
+    return sql, [city]
+
+
+def infrastructure_sql(city):
+    sql = """
+        SELECT facility_name, infra_type, latitude, longitude
+        FROM Infrastructure
+        WHERE sigungu = ? AND latitude IS NOT NULL AND longitude IS NOT NULL
+    """
+    return sql, [city]
+
+
+def bus_monthly_sql(city, year=None):
+    # 시 이름이 들어간 시군구의 월별 합계 ("경기도 수원시" / "수원시" 모두 → '%수원시%'), year 없으면 전체 연도
+    sql = """
+        SELECT year, month, SUM(passengers) AS total_passengers
+        FROM BusUsage
+        WHERE sigungu LIKE ?{year_cond}
+        GROUP BY year, month
+    """
+    params = [f"%{short_city(city) or city}%"]
+    if year is None:
+        return sql.format(year_cond=''), params
+    return sql.format(year_cond=' AND year = ?'), params + [int(year)]
+
+
+def bus_averages(rows):
+    # bus_monthly_sql 결과 → {year: 월평균 이용객}
+    totals = {}
+    for row in rows:
+        totals.setdefault(int(row['year']), []).append(float(row['total_passengers']))
+    return {year: round(sum(v) / len(v), 2) for year, v in totals.items()}
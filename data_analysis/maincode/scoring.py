@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+# ========================================
+# scoring.py
+#  구성 점수 행렬 × 목적별 가중치 행렬 → 모든 추천 목적 점수를 한 번에 계산
+# ========================================
+
+    # - 구성 점수(거래 / 인구 / 버스 / 인프라 / 학교, 0~100)는 Score·ScoreGroup에 컬럼으로 저장
+    # - 목적(프로필) = 구성 점수 가중치, 점수 = C(행 × 구성) @ W(구성 × 목적) 한 번
+    # - 목적 추가는 PROFILES에 항목 하나 → insert_Score.py의 ScoreTopN 재생성과 main.py 메뉴에 자동 반영
+    #   (데이터 재조회나 목적별 추가 패스 없음)
+    # - residence / investment 점수는 기존 조회 호환을 위해 Score 컬럼으로도 저장
+
+COMPONENTS = ['transaction_score', 'total_population_score', 'total_passengers_score',
+              'infra_raw_score', 'school_count_score']
+
+# 거래 점수 = 그룹 평균 가격 / 면적 / 건축년도 정규화 점수 가중합
+TRANSACTION_WEIGHTS = {'price_score': 0.4, 'area_score': 0.3, 'build_year_score': 0.3}
+
+# 목적 번호(main.py 메뉴 / ScoreTopN.purpose) → 이름, 메뉴 표시, 구성 점수 가중치
+PROFILES = {
+    1: {'name': 'residence', 'label': '실거주 목적',
+        'weights': {'transaction_score': 0.2, 'total_population_score': 0.2, 'total_passengers_score': 0.1,
+                    'infra_raw_score': 0.2, 'school_count_score': 0.3}},
+    2: {'name': 'investment', 'label': '투자 목적',
+        'weights': {'transaction_score': 0.5, 'total_population_score': 0.3, 'total_passengers_score': 0.05,
+                    'infra_raw_score': 0.05, 'school_count_score': 0.1}},
+    3: {'name': 'family', 'label': '자녀 양육 가구',
+        'weights': {'transaction_score': 0.15, 'total_population_score': 0.15, 'total_passengers_score': 0.1,
+                    'infra_raw_score': 0.2, 'school_count_score': 0.4}},
+    4: {'name': 'retiree', 'label': '은퇴 가구',
+        'weights': {'transaction_score': 0.2, 'total_population_score': 0.1, 'total_passengers_score': 0.25,
+                    'infra_raw_score': 0.4, 'school_count_score': 0.05}},
+    5: {'name': 'short_term', 'label': '단기 투자',
+        'weights': {'transaction_score': 0.6, 'total_population_score': 0.25, 'total_passengers_score': 0.1,
+                    'infra_raw_score': 0.05}},
+}
+
+# Score 테이블에 컬럼으로 저장하는 목적 (idx_sigungu_residence / idx_sigungu_investment)
+STORED_PURPOSES = [1, 2]
+
+
+def profile_column(purpose: int) -> str:
+    return f"{PROFILES[purpose]['name']}_score"
+
+
+def weight_matrix(purposes=None, components=COMPONENTS) -> np.ndarray:
+    """(구성 점수 수 × 목적 수) 가중치 행렬, 가중치 없는 구성 점수는 0"""
+    purposes = list(PROFILES) if purposes is None else list(purposes)
+    w = np.zeros((len(components), len(purposes)))
+    for j, purpose in enumerate(purposes):
+        weights = PROFILES[purpose]['weights']
+        unknown = set(weights) - set(components)
+        if unknown:
+            raise ValueError(f"{PROFILES[purpose]['name']}: 알 수 없는 구성 점수 {sorted(unknown)}")
+        for i, comp in enumerate(components):
+            w[i, j] = weights.get(comp, 0.0)
+    return w
+
+
+def weighted_sum(df: pd.DataFrame, weights: dict) -> np.ndarray:
+    """가중치 하나(dict) → 행별 가중합 (결측 구성 점수는 0)"""
+    cols = list(weights)
+    return np.nan_to_num(df[cols].to_numpy(dtype=float)) @ np.array([weights[c] for c in cols])
+
+
+def profile_scores(df: pd.DataFrame, purposes=None, decimals: int = 2) -> pd.DataFrame:
+    """구성 점수 컬럼 → 목적별 점수 DataFrame (컬럼: {name}_score, df와 같은 index)"""
+    purposes = list(PROFILES) if purposes is None else list(purposes)
+    c = np.nan_to_num(df[COMPONENTS].to_numpy(dtype=float))
+    scores = np.round(c @ weight_matrix(purposes), decimals)
+    return pd.DataFrame(scores, index=df.index, columns=[profile_column(p) for p in purposes])
+
+
+def score_sql(purpose: int, alias: str = 's') -> str:
+    """Score 구성 점수 컬럼으로 목적 점수를 계산하는 SQL 식 (가중치는 코드 상수라 그대로 삽입)"""
+    weights = PROFILES[purpose]['weights']
+    return ' + '.join(f"{alias}.`{comp}` * {float(weights[comp])!r}" for comp in COMPONENTS if comp in weights)
+
+
+def menu_text() -> str:
+    return '\n'.join(f"{purpose}. {profile['label']}" for purpose, profile in PROFILES.items())
+
+
+if __name__ == '__main__':
+    import time
+
+    # 백만 행 × 목적 5개: 목적별 컬럼 연산 vs 행렬곱 한 번
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.uniform(0, 100, (1_000_000, len(COMPONENTS))), columns=COMPONENTS)
+
+    start = time.perf_counter()
+    loop = pd.DataFrame({profile_column(p): sum(df[c] * w for c, w in PROFILES[p]['weights'].items()).round(2)
+                         for p in PROFILES})
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matmul = profile_scores(df)
+    t_matmul = time.perf_counter() - start
+
+    same = np.allclose(loop.to_numpy(), matmul.to_numpy(), atol=0.011)
+    print(f"목적 {len(PROFILES)}개: 컬럼 연산 {t_loop:.3f}s / 행렬곱 {t_matmul:.3f}s "
+          f"{'✅ 결과 일치' if same else '❌ 결과 불일치'}")